@@ -1,17 +1,25 @@
 "use client"
 
+import type { TVState } from "@/lib/ha-websocket"
+
 interface ConnectionStatusProps {
   isConnected: boolean
   lastCommand: string | null
+  tvState?: TVState | null
 }
 
-export function ConnectionStatus({ isConnected, lastCommand }: ConnectionStatusProps) {
+export function ConnectionStatus({ isConnected, lastCommand, tvState }: ConnectionStatusProps) {
   return (
     <div className="flex items-center gap-2">
       <div className={`w-2 h-2 rounded-full ${isConnected ? "bg-green-500" : "bg-zinc-600"}`} />
       <span className="text-zinc-500 text-xs">
         {lastCommand ? `Letzter Befehl: ${lastCommand}` : "Nicht verbunden"}
       </span>
+      {tvState && (
+        <span className="text-zinc-500 text-xs">
+          {tvState.power ? `· Vol ${tvState.volume ?? "–"}` : "· Aus"}
+        </span>
+      )}
     </div>
   )
 }
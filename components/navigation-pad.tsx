@@ -1,11 +1,28 @@
 "use client"
+import type React from "react"
 import { ChevronUp, ChevronDown, ChevronLeft, ChevronRight } from "lucide-react"
 
 interface NavigationPadProps {
   onCommand: (command: string) => void
+  onPressStart?: (command: string) => void
+  onPressEnd?: (command: string) => void
 }
 
-export function NavigationPad({ onCommand }: NavigationPadProps) {
+export function NavigationPad({ onCommand, onPressStart, onPressEnd }: NavigationPadProps) {
+  // Arrow keys repeat while held when a hold handler is available
+  const holdProps = (command: string) =>
+    onPressStart && onPressEnd
+      ? {
+          onPointerDown: () => onPressStart(command),
+          onPointerUp: () => onPressEnd(command),
+          // A touch that turns into a scroll is cancelled without a pointerup
+          onPointerCancel: () => onPressEnd(command),
+          onPointerLeave: (event: React.PointerEvent) => {
+            if (event.buttons) onPressEnd(command)
+          },
+        }
+      : { onClick: () => onCommand(command) }
+
   return (
     <div className="mb-6">
       <div className="relative w-48 h-48 mx-auto">
@@ -14,28 +31,28 @@ export function NavigationPad({ onCommand }: NavigationPadProps) {
 
         {/* Direction buttons */}
         <button
-          onClick={() => onCommand("UP")}
+          {...holdProps("UP")}
           className="absolute top-2 left-1/2 -translate-x-1/2 w-14 h-14 rounded-full bg-zinc-700 hover:bg-zinc-600 flex items-center justify-center transition-colors active:scale-95"
         >
           <ChevronUp className="w-6 h-6 text-zinc-100" />
         </button>
 
         <button
-          onClick={() => onCommand("DOWN")}
+          {...holdProps("DOWN")}
           className="absolute bottom-2 left-1/2 -translate-x-1/2 w-14 h-14 rounded-full bg-zinc-700 hover:bg-zinc-600 flex items-center justify-center transition-colors active:scale-95"
         >
           <ChevronDown className="w-6 h-6 text-zinc-100" />
         </button>
 
         <button
-          onClick={() => onCommand("LEFT")}
+          {...holdProps("LEFT")}
           className="absolute left-2 top-1/2 -translate-y-1/2 w-14 h-14 rounded-full bg-zinc-700 hover:bg-zinc-600 flex items-center justify-center transition-colors active:scale-95"
         >
           <ChevronLeft className="w-6 h-6 text-zinc-100" />
         </button>
 
         <button
-          onClick={() => onCommand("RIGHT")}
+          {...holdProps("RIGHT")}
           className="absolute right-2 top-1/2 -translate-y-1/2 w-14 h-14 rounded-full bg-zinc-700 hover:bg-zinc-600 flex items-center justify-center transition-colors active:scale-95"
         >
           <ChevronRight className="w-6 h-6 text-zinc-100" />
@@ -1,6 +1,6 @@
 "use client"
 
-import { useState, useCallback } from "react"
+import { useState, useCallback, useEffect, useRef } from "react"
 import { Card } from "@/components/ui/card"
 import { PowerSection } from "@/components/power-section"
 import { NavigationPad } from "@/components/navigation-pad"
@@ -11,6 +11,11 @@ import { ColorButtons } from "@/components/color-buttons"
 import { SourceSelector } from "@/components/source-selector"
 import { ConnectionStatus } from "@/components/connection-status"
 import { SettingsDialog } from "@/components/settings-dialog"
+import { HomeAssistantSocket, type TVState } from "@/lib/ha-websocket"
+
+// The integration ends a hold 2 s after the last press_start, so a held key
+// renews it at half that interval
+const HOLD_RENEW_MS = 1000
 
 export function SamsungRemote() {
   const [haUrl, setHaUrl] = useState("")
@@ -18,6 +23,37 @@ export function SamsungRemote() {
   const [entityId, setEntityId] = useState("remote.samsung_tv")
   const [isConnected, setIsConnected] = useState(false)
   const [lastCommand, setLastCommand] = useState<string | null>(null)
+  const [tvState, setTvState] = useState<TVState | null>(null)
+  const socketRef = useRef<HomeAssistantSocket | null>(null)
+  const holdTimersRef = useRef(new Map<string, ReturnType<typeof setInterval>>())
+
+  // Keep one websocket open for keys and state updates
+  useEffect(() => {
+    if (!haUrl || !token || !entityId) {
+      return
+    }
+
+    const socket = new HomeAssistantSocket(haUrl, token, setIsConnected)
+    socketRef.current = socket
+    let unsubscribe: (() => void) | undefined
+
+    socket
+      .subscribe({ type: "samsung_remote/subscribe_state", entity_id: entityId }, (event) =>
+        setTvState(event as TVState),
+      )
+      .then((unsub) => {
+        unsubscribe = unsub
+      })
+      .catch((error) => console.error("State subscription failed:", error))
+
+    return () => {
+      unsubscribe?.()
+      socket.close()
+      if (socketRef.current === socket) {
+        socketRef.current = null
+      }
+    }
+  }, [haUrl, token, entityId])
 
   const sendCommand = useCallback(
     async (command: string) => {
@@ -28,6 +64,16 @@ export function SamsungRemote() {
 
       setLastCommand(command)
 
+      if (socketRef.current) {
+        try {
+          await socketRef.current.call({ type: "samsung_remote/send_key", entity_id: entityId, key: command })
+          setIsConnected(true)
+          return
+        } catch (error) {
+          console.warn("Websocket command failed, falling back to REST:", error)
+        }
+      }
+
       try {
         const response = await fetch(`${haUrl}/api/services/remote/send_command`, {
           method: "POST",
@@ -55,6 +101,37 @@ export function SamsungRemote() {
     [haUrl, token, entityId],
   )
 
+  // Held keys go through the integration's hold engine; without a websocket
+  // a hold degrades to a single key press.
+  const pressStart = useCallback(
+    (command: string) => {
+      if (!socketRef.current) {
+        sendCommand(command)
+        return
+      }
+      setLastCommand(command)
+      const start = () =>
+        socketRef.current
+          ?.call({ type: "samsung_remote/press_start", entity_id: entityId, key: command })
+          .catch((error) => console.error("Hold failed:", error))
+      start()
+      clearInterval(holdTimersRef.current.get(command))
+      holdTimersRef.current.set(command, setInterval(start, HOLD_RENEW_MS))
+    },
+    [entityId, sendCommand],
+  )
+
+  const pressEnd = useCallback(
+    (command: string) => {
+      clearInterval(holdTimersRef.current.get(command))
+      holdTimersRef.current.delete(command)
+      socketRef.current
+        ?.call({ type: "samsung_remote/press_end", entity_id: entityId, key: command })
+        .catch((error) => console.error("Release failed:", error))
+    },
+    [entityId],
+  )
+
   const handleSettingsSave = (url: string, accessToken: string, entity: string) => {
     setHaUrl(url)
     setToken(accessToken)
@@ -103,7 +180,7 @@ export function SamsungRemote() {
           </div>
           <div>
             <h1 className="text-white font-semibold text-lg">Samsung TV</h1>
-            <ConnectionStatus isConnected={isConnected} lastCommand={lastCommand} />
+            <ConnectionStatus isConnected={isConnected} lastCommand={lastCommand} tvState={tvState} />
           </div>
         </div>
         <SettingsDialog onSave={handleSettingsSave} currentUrl={haUrl} currentToken={token} currentEntity={entityId} />
@@ -113,10 +190,10 @@ export function SamsungRemote() {
       <PowerSection onCommand={sendCommand} />
 
       {/* Navigation */}
-      <NavigationPad onCommand={sendCommand} />
+      <NavigationPad onCommand={sendCommand} onPressStart={pressStart} onPressEnd={pressEnd} />
 
       {/* Volume & Channel */}
-      <VolumeChannelControls onCommand={sendCommand} />
+      <VolumeChannelControls onCommand={sendCommand} onPressStart={pressStart} onPressEnd={pressEnd} />
 
       {/* Playback */}
       <PlaybackControls onCommand={sendCommand} />
@@ -1,11 +1,28 @@
 "use client"
+import type React from "react"
 import { VolumeX, Plus, Minus } from "lucide-react"
 
 interface VolumeChannelControlsProps {
   onCommand: (command: string) => void
+  onPressStart?: (command: string) => void
+  onPressEnd?: (command: string) => void
 }
 
-export function VolumeChannelControls({ onCommand }: VolumeChannelControlsProps) {
+export function VolumeChannelControls({ onCommand, onPressStart, onPressEnd }: VolumeChannelControlsProps) {
+  // Volume keys repeat while held when a hold handler is available
+  const holdProps = (command: string) =>
+    onPressStart && onPressEnd
+      ? {
+          onPointerDown: () => onPressStart(command),
+          onPointerUp: () => onPressEnd(command),
+          // A touch that turns into a scroll is cancelled without a pointerup
+          onPointerCancel: () => onPressEnd(command),
+          onPointerLeave: (event: React.PointerEvent) => {
+            if (event.buttons) onPressEnd(command)
+          },
+        }
+      : { onClick: () => onCommand(command) }
+
   return (
     <div className="grid grid-cols-2 gap-6 mb-6">
       {/* Volume Controls */}
@@ -13,7 +30,7 @@ export function VolumeChannelControls({ onCommand }: VolumeChannelControlsProps)
         <span className="text-zinc-500 text-xs mb-2 uppercase tracking-wider">Volume</span>
         <div className="flex flex-col gap-1 bg-zinc-800 rounded-2xl p-1 border border-zinc-700">
           <button
-            onClick={() => onCommand("VOLUME_UP")}
+            {...holdProps("VOLUME_UP")}
             className="w-16 h-12 rounded-xl bg-zinc-700 hover:bg-zinc-600 flex items-center justify-center transition-colors active:scale-95"
           >
             <Plus className="w-5 h-5 text-zinc-100" />
@@ -25,7 +42,7 @@ export function VolumeChannelControls({ onCommand }: VolumeChannelControlsProps)
             <VolumeX className="w-4 h-4 text-zinc-400" />
           </button>
           <button
-            onClick={() => onCommand("VOLUME_DOWN")}
+            {...holdProps("VOLUME_DOWN")}
             className="w-16 h-12 rounded-xl bg-zinc-700 hover:bg-zinc-600 flex items-center justify-center transition-colors active:scale-95"
           >
             <Minus className="w-5 h-5 text-zinc-100" />
@@ -2,23 +2,114 @@
 
 This integration uses the existing SmartThings integration for authentication,
 eliminating the need for separate token management.
+
+Setup only waits for the API the first time a TV is set up; afterwards
+its stored description is used and the device info and first status are
+fetched in the background.
 """
 from __future__ import annotations
 
+import asyncio
+from fnmatch import fnmatch
 import logging
 from typing import Any
 
+import voluptuous as vol
+
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers import device_registry as dr
-from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.const import CONF_SCAN_INTERVAL, Platform
+from homeassistant.core import HomeAssistant, ServiceResponse, SupportsResponse, callback
+from homeassistant.helpers import config_validation as cv, device_registry as dr
+from homeassistant.helpers.typing import ConfigType
+from homeassistant.exceptions import (
+    ConfigEntryNotReady,
+    HomeAssistantError,
+    ServiceValidationError,
+)
 
-from .const import DOMAIN, CONF_DEVICE_ID, CONF_SMARTTHINGS_ENTRY_ID
-from .smartthings_bridge import SmartThingsBridge
+from .commands import KEY_SET
+from .const import (
+    DOMAIN,
+    CONF_DEVICE_ID,
+    CONF_DEVICE_NAME,
+    CONF_SMARTTHINGS_ENTRY_ID,
+    DEFAULT_SCAN_INTERVAL,
+    HOLD_ACCELERATION,
+)
+from .channels import ChannelIndex
+from .coordinator import SamsungTVCoordinator
+from .entity import SamsungTVContext
+from .fleet import FleetTarget, async_run_group
+from .hold import HoldController
+from .smartthings_bridge import SmartThingsBridge, async_remove_device_info
+from .websocket_api import async_setup_websocket_api
 
 _LOGGER = logging.getLogger(__name__)
 
+# Compiled once; keys are matched in any case like the remote entity does
+KEY_VALIDATOR = vol.All(cv.string, vol.Upper, vol.In(KEY_SET))
+
+SEND_KEY_SCHEMA = vol.Schema(
+    {
+        vol.Required("entry_id"): cv.string,
+        vol.Required("key"): KEY_VALIDATOR,
+    }
+)
+
+PRESS_START_SCHEMA = vol.Schema(
+    {
+        vol.Required("entry_id"): cv.string,
+        vol.Required("key"): KEY_VALIDATOR,
+        vol.Optional("acceleration", default=HOLD_ACCELERATION): vol.All(
+            vol.Coerce(float), vol.Range(min=1.0, max=3.0)
+        ),
+    }
+)
+
+PRESS_END_SCHEMA = vol.Schema(
+    {
+        vol.Required("entry_id"): cv.string,
+        vol.Required("key"): KEY_VALIDATOR,
+    }
+)
+
+SET_PROFILING_SCHEMA = vol.Schema(
+    {
+        vol.Required("entry_id"): cv.string,
+        vol.Optional("enabled", default=True): cv.boolean,
+    }
+)
+
+CHANNEL_SCHEMA = vol.Schema(
+    {
+        vol.Required("number"): vol.All(vol.Coerce(int), vol.Range(min=1)),
+        vol.Optional("name"): cv.string,
+        vol.Optional("favorite", default=False): cv.boolean,
+    }
+)
+
+IMPORT_CHANNELS_SCHEMA = vol.Schema(
+    {
+        vol.Required("entry_id"): cv.string,
+        vol.Required("channels"): vol.All(cv.ensure_list, [CHANNEL_SCHEMA]),
+        vol.Optional("replace", default=True): cv.boolean,
+    }
+)
+
+# Exactly one action; entry_ids must be a list, a string would match substrings
+GROUP_COMMAND_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            vol.Exclusive("key", "action"): KEY_VALIDATOR,
+            vol.Exclusive("source", "action"): cv.string,
+            vol.Exclusive("app", "action"): cv.string,
+            vol.Optional("entry_ids"): vol.All(cv.ensure_list, [cv.string]),
+            vol.Optional("name_filter"): cv.string,
+        }
+    ),
+    cv.has_at_least_one_key("key", "source", "app"),
+)
+
 PLATFORMS: list[Platform] = [
     Platform.REMOTE,
     Platform.BUTTON,
@@ -26,8 +117,17 @@ PLATFORMS: list[Platform] = [
     Platform.NUMBER,
     Platform.SELECT,
     Platform.SENSOR,
+    Platform.MEDIA_PLAYER,
 ]
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the Samsung Remote component."""
+    async_setup_websocket_api(hass)
+    return True
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Samsung Remote from a config entry."""
@@ -49,46 +149,224 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # Create the bridge to SmartThings
     try:
         bridge = SmartThingsBridge(hass, smartthings_entry, device_id)
-        await bridge.async_initialize()
+        from_store = await bridge.async_initialize()
     except Exception as err:
         _LOGGER.error("Failed to initialize SmartThings bridge: %s", err)
         raise ConfigEntryNotReady(f"Failed to connect: {err}") from err
     
+    coordinator = SamsungTVCoordinator(
+        hass, bridge, entry.options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
+    )
+    hold = HoldController(bridge)
+    
     hass.data[DOMAIN][entry.entry_id] = {
         "bridge": bridge,
         "device_id": device_id,
+        "hold": hold,
+        "coordinator": coordinator,
+        "context": SamsungTVContext.create(
+            entry_id=entry.entry_id,
+            device_id=device_id,
+            device_name=entry.data.get(CONF_DEVICE_NAME, "Samsung TV"),
+            bridge=bridge,
+            coordinator=coordinator,
+            hold=hold,
+        ),
     }
     
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    entry.async_on_unload(entry.add_update_listener(async_reload_entry))
     
     # Register services
     await async_register_services(hass)
     
+    # The entities exist already and fill in once the network phase is done
+    entry.async_create_background_task(
+        hass,
+        _async_network_setup(hass, entry, bridge, coordinator, from_store),
+        f"{DOMAIN} network setup {device_id}",
+    )
+    
     return True
 
 
+async def _async_network_setup(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    bridge: SmartThingsBridge,
+    coordinator: SamsungTVCoordinator,
+    refresh_device_info: bool,
+) -> None:
+    """Fetch what the local setup phase skipped.
+    
+    The first status is read while the stored device info is refreshed.
+    """
+    if not refresh_device_info:
+        await coordinator.async_refresh()
+        return
+    
+    changed, _ = await asyncio.gather(
+        bridge.async_refresh_device_info(), coordinator.async_refresh(), return_exceptions=True
+    )
+    if isinstance(changed, ValueError):
+        _LOGGER.warning("Failed to refresh device info: %s", changed)
+    elif isinstance(changed, BaseException):
+        raise changed
+    elif changed:
+        # Entities depend on the components, recreate them
+        _LOGGER.info("Components of %s changed, reloading", bridge.device_id)
+        hass.async_create_task(hass.config_entries.async_reload(entry.entry_id))
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
-        hass.data[DOMAIN].pop(entry.entry_id)
+        data = hass.data[DOMAIN].pop(entry.entry_id)
+        await data["hold"].async_release_all()
+        await data["coordinator"].async_shutdown()
+        await data["bridge"].async_shutdown()
     
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the stored channel index and device info of a removed TV."""
+    if device_id := entry.data.get(CONF_DEVICE_ID):
+        await ChannelIndex(hass, device_id).async_clear()
+        await async_remove_device_info(hass, device_id)
+
+
+async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Reload the config entry when its options change."""
+    await hass.config_entries.async_reload(entry.entry_id)
+
+
+@callback
+def _async_get_entry_data(hass: HomeAssistant, entry_id: str) -> dict[str, Any]:
+    """Return the data of a set up TV, or raise for a service call."""
+    if (data := hass.data.get(DOMAIN, {}).get(entry_id)) is None:
+        raise ServiceValidationError(
+            f"No Samsung TV is set up with entry ID {entry_id}",
+            translation_domain=DOMAIN,
+            translation_key="unknown_entry",
+            translation_placeholders={"entry_id": entry_id},
+        )
+    return data
+
+
 async def async_register_services(hass: HomeAssistant) -> None:
     """Register custom services."""
     
     async def handle_send_key(call) -> None:
         """Handle the send_key service call."""
-        entry_id = call.data.get("entry_id")
+        # The schema has checked the key; reject unknown TVs before any I/O
+        data = _async_get_entry_data(hass, call.data["entry_id"])
+        if not await data["bridge"].send_command(call.data["key"]):
+            raise HomeAssistantError(
+                f"Failed to send {call.data['key']}",
+                translation_domain=DOMAIN,
+                translation_key="command_failed",
+                translation_placeholders={"key": call.data["key"]},
+            )
+    
+    async def handle_press_start(call) -> None:
+        """Handle the press_start service call."""
+        data = _async_get_entry_data(hass, call.data["entry_id"])
+        data["hold"].async_press_start(call.data["key"], call.data["acceleration"])
+    
+    async def handle_press_end(call) -> None:
+        """Handle the press_end service call."""
+        data = _async_get_entry_data(hass, call.data["entry_id"])
+        await data["hold"].async_press_end(call.data["key"])
+    
+    async def handle_set_profiling(call) -> None:
+        """Handle the set_profiling service call."""
+        bridge = _async_get_entry_data(hass, call.data["entry_id"])["bridge"]
+        if call.data["enabled"]:
+            bridge.profiler.start()
+        elif bridge.profiler.enabled:
+            bridge.profiler.stop()
+            bridge.profiler.log_summary(bridge.device_id)
+    
+    async def handle_import_channels(call) -> None:
+        """Handle the import_channels service call."""
+        data = _async_get_entry_data(hass, call.data["entry_id"])
+        count = await data["bridge"].channels.async_import(
+            call.data["channels"], call.data["replace"]
+        )
+        if not count:
+            # An empty lineup would reject every channel
+            raise ServiceValidationError(
+                "No valid channels to import",
+                translation_domain=DOMAIN,
+                translation_key="no_channels",
+            )
+        _LOGGER.info("Imported %d channels", count)
+        # Entities showing favourites pick up the new lineup
+        data["coordinator"].async_update_listeners()
+    
+    async def handle_group_command(call) -> ServiceResponse:
+        """Handle the group_command service call."""
         key = call.data.get("key")
+        source = call.data.get("source")
+        app = call.data.get("app")
+        entry_ids = call.data.get("entry_ids")
+        name_filter = call.data.get("name_filter")
+        
+        async def action(bridge: SmartThingsBridge) -> bool:
+            """Run the requested action on one TV."""
+            if key is not None:
+                return await bridge.send_command(key)
+            if source is not None:
+                return await bridge.async_select_source(source)
+            return await bridge.async_launch_app(app)
         
-        if entry_id and entry_id in hass.data[DOMAIN]:
-            bridge = hass.data[DOMAIN][entry_id]["bridge"]
-            await bridge.send_command(key)
+        targets = [
+            FleetTarget(entry_id, name, data["bridge"])
+            for entry_id, data in hass.data.get(DOMAIN, {}).items()
+            if (name := data["context"].device_info["name"])
+            and (not entry_ids or entry_id in entry_ids)
+            and (not name_filter or fnmatch(name.lower(), name_filter.lower()))
+        ]
+        result = await async_run_group(targets, action)
+        return result if call.return_response else None
     
     if not hass.services.has_service(DOMAIN, "send_key"):
-        hass.services.async_register(DOMAIN, "send_key", handle_send_key)
+        hass.services.async_register(
+            DOMAIN, "send_key", handle_send_key, schema=SEND_KEY_SCHEMA
+        )
+    
+    if not hass.services.has_service(DOMAIN, "press_start"):
+        hass.services.async_register(
+            DOMAIN, "press_start", handle_press_start, schema=PRESS_START_SCHEMA
+        )
+    
+    if not hass.services.has_service(DOMAIN, "press_end"):
+        hass.services.async_register(
+            DOMAIN, "press_end", handle_press_end, schema=PRESS_END_SCHEMA
+        )
+    
+    if not hass.services.has_service(DOMAIN, "set_profiling"):
+        hass.services.async_register(
+            DOMAIN, "set_profiling", handle_set_profiling, schema=SET_PROFILING_SCHEMA
+        )
+    
+    if not hass.services.has_service(DOMAIN, "import_channels"):
+        hass.services.async_register(
+            DOMAIN,
+            "import_channels",
+            handle_import_channels,
+            schema=IMPORT_CHANNELS_SCHEMA,
+        )
+    
+    if not hass.services.has_service(DOMAIN, "group_command"):
+        hass.services.async_register(
+            DOMAIN,
+            "group_command",
+            handle_group_command,
+            schema=GROUP_COMMAND_SCHEMA,
+            supports_response=SupportsResponse.OPTIONAL,
+        )
 
 
 async def async_migrate_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> bool:
@@ -0,0 +1,80 @@
+"""Component-aware capability index for Samsung TV Remote integration.
+
+Some devices split their capabilities over several SmartThings components,
+e.g. a TV with a soundbar component. The index records which components
+provide each capability, with "main" preferred, so commands and status
+reads go to the component that actually has the capability.
+"""
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .commands import CommandDescriptor
+
+MAIN_COMPONENT = "main"
+
+
+class CapabilityIndex:
+    """Capabilities of a device by component."""
+    
+    __slots__ = ("_by_capability", "_by_component")
+    
+    def __init__(self, device_info: Mapping[str, Any] | None = None) -> None:
+        """Build the index from a SmartThings device description."""
+        self._by_component: dict[str, frozenset[str]] = {}
+        self._by_capability: dict[str, tuple[str, ...]] = {}
+        
+        for component in (device_info or {}).get("components", []):
+            if not isinstance(component, dict) or not (component_id := component.get("id")):
+                continue
+            self._by_component[component_id] = frozenset(
+                cap["id"]
+                for cap in component.get("capabilities", [])
+                if isinstance(cap, dict) and "id" in cap
+            )
+        
+        # Main first, then the other components in the order the device lists them
+        ordered = sorted(self._by_component, key=lambda component_id: component_id != MAIN_COMPONENT)
+        for component_id in ordered:
+            for capability in self._by_component[component_id]:
+                self._by_capability[capability] = (
+                    *self._by_capability.get(capability, ()),
+                    component_id,
+                )
+    
+    @property
+    def components(self) -> list[str]:
+        """Return the component IDs."""
+        return list(self._by_component)
+    
+    def capabilities(self, component: str = MAIN_COMPONENT) -> frozenset[str]:
+        """Return the capabilities of a component."""
+        return self._by_component.get(component, frozenset())
+    
+    def component_for(self, capability: str) -> str | None:
+        """Return the component a capability is used on."""
+        components = self._by_capability.get(capability)
+        return components[0] if components else None
+    
+    def secondary_components(self, capability: str) -> tuple[str, ...]:
+        """Return further components providing a capability.
+        
+        These are not reached through the device-level entities and get
+        entities of their own.
+        """
+        return self._by_capability.get(capability, ())[1:]
+    
+    def route(self, commands: Mapping[str, CommandDescriptor]) -> dict[str, CommandDescriptor]:
+        """Return the commands addressed to the component providing them.
+        
+        Commands for capabilities the index does not know keep their
+        configured component.
+        """
+        return {
+            name: descriptor.for_component(component)
+            if (component := self.component_for(descriptor.capability)) is not None
+            else descriptor
+            for name, descriptor in commands.items()
+        }
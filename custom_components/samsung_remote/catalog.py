@@ -0,0 +1,78 @@
+"""Input source catalog for Samsung TV Remote integration."""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+from .const import HDMI_SOURCES
+
+
+@dataclass(frozen=True, slots=True)
+class SourceCatalog:
+    """The input sources of a TV and how to switch to them.
+    
+    ``command`` is the ``COMMANDS`` entry that switches directly to a
+    source ID. Without it sources are selected by sending their remote key.
+    """
+    
+    command: str | None
+    by_name: dict[str, str]
+    by_id: dict[str, str]
+    names: tuple[str, ...]
+    # The reported source list, kept to detect changes cheaply
+    raw: Any = None
+    
+    @classmethod
+    def create(cls, command: str | None, sources: dict[str, str], raw: Any = None) -> SourceCatalog:
+        """Create a catalog from a mapping of display name to source ID."""
+        return cls(
+            command=command,
+            by_name=sources,
+            by_id={source_id: name for name, source_id in sources.items()},
+            names=tuple(sources),
+            raw=raw,
+        )
+    
+    def name_of(self, source_id: str | None) -> str | None:
+        """Return the display name of a source ID."""
+        if source_id is None:
+            return None
+        return self.by_id.get(source_id)
+
+
+DEFAULT_SOURCES = SourceCatalog.create(None, {source: source for source in HDMI_SOURCES})
+
+
+def update_source_catalog(
+    current: SourceCatalog,
+    source_map: Any,
+    source_list: Any,
+) -> SourceCatalog:
+    """Return the catalog for the reported source lists.
+    
+    ``source_map`` is Samsung's ``supportedInputSourcesMap`` with display
+    names next to the IDs and is preferred over the standard
+    ``supportedInputSources`` list. The catalog is only rebuilt when the
+    reported list changed.
+    """
+    if isinstance(source_map, list) and source_map:
+        if source_map == current.raw:
+            return current
+        return SourceCatalog.create(
+            "SET_SAMSUNG_INPUT_SOURCE",
+            {
+                str(item.get("name") or item["id"]): str(item["id"])
+                for item in source_map
+                if isinstance(item, dict) and item.get("id")
+            },
+            source_map,
+        )
+    
+    if isinstance(source_list, list) and source_list:
+        if source_list == current.raw:
+            return current
+        return SourceCatalog.create(
+            "SET_INPUT_SOURCE", {str(source): str(source) for source in source_list}, source_list
+        )
+    
+    return DEFAULT_SOURCES
@@ -0,0 +1,152 @@
+"""Channel index for Samsung TV Remote integration.
+
+Channels are learned from the status the TV reports while they are
+watched, and a full lineup can be imported by the user. Only an imported
+lineup is used to reject channels, since a learned index is incomplete.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+import logging
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+SAVE_DELAY = 30
+
+
+@dataclass(frozen=True, slots=True)
+class Channel:
+    """One channel of the lineup."""
+    
+    number: int
+    name: str | None = None
+    favorite: bool = False
+    
+    @property
+    def label(self) -> str:
+        """Return the number and name for display."""
+        return f"{self.number} {self.name}" if self.name else str(self.number)
+    
+    def as_dict(self) -> dict[str, Any]:
+        """Return the channel as stored."""
+        return {"number": self.number, "name": self.name, "favorite": self.favorite}
+
+
+class ChannelIndex:
+    """Known channels of one TV, persisted across restarts."""
+    
+    def __init__(self, hass: HomeAssistant, device_id: str) -> None:
+        """Initialize an empty index."""
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.channels.{device_id}"
+        )
+        self._channels: dict[int, Channel] = {}
+        self._imported = False
+    
+    @property
+    def channels(self) -> list[Channel]:
+        """Return the known channels ordered by number."""
+        return sorted(self._channels.values(), key=lambda channel: channel.number)
+    
+    @property
+    def favorites(self) -> list[Channel]:
+        """Return the favourite channels ordered by number."""
+        return [channel for channel in self.channels if channel.favorite]
+    
+    @property
+    def imported(self) -> bool:
+        """Return if the index holds a user-imported lineup."""
+        return self._imported
+    
+    def get(self, number: int) -> Channel | None:
+        """Return a known channel."""
+        return self._channels.get(number)
+    
+    def is_valid(self, number: int) -> bool:
+        """Return if a channel may exist.
+        
+        Without an imported lineup every channel is allowed.
+        """
+        return not self._imported or number in self._channels
+    
+    async def async_load(self) -> None:
+        """Load the stored index."""
+        if (data := await self._store.async_load()) is None:
+            return
+        self._imported = data.get("imported", False)
+        self._channels = {
+            channel.number: channel
+            for item in data.get("channels", [])
+            if (channel := _parse_channel(item)) is not None
+        }
+    
+    @callback
+    def async_learn(self, number: int, name: str | None) -> None:
+        """Add a channel the TV reported, or update its name."""
+        channel = self._channels.get(number)
+        if channel is not None and (not name or channel.name == name):
+            return
+        
+        self._channels[number] = Channel(
+            number, name or None, channel.favorite if channel else False
+        )
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+    
+    async def async_import(self, items: list[dict[str, Any]], replace: bool = True) -> int:
+        """Import a lineup and return the number of channels imported.
+        
+        Malformed entries are skipped. With ``replace`` the imported list
+        becomes the whole lineup, otherwise it is merged into the index.
+        If no entry is valid the index is left unchanged.
+        """
+        channels = {}
+        for item in items:
+            if (channel := _parse_channel(item)) is None:
+                _LOGGER.warning("Skipping invalid channel entry: %s", item)
+                continue
+            channels[channel.number] = channel
+        if not channels:
+            return 0
+        
+        if replace:
+            self._channels = channels
+        else:
+            self._channels.update(channels)
+        self._imported = True
+        await self._store.async_save(self._data_to_save())
+        return len(channels)
+    
+    async def async_clear(self) -> None:
+        """Forget all channels."""
+        self._channels = {}
+        self._imported = False
+        await self._store.async_remove()
+    
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the index as stored."""
+        return {
+            "imported": self._imported,
+            "channels": [channel.as_dict() for channel in self.channels],
+        }
+
+
+def _parse_channel(item: Any) -> Channel | None:
+    """Return a channel from a stored or imported entry."""
+    if not isinstance(item, dict):
+        return None
+    try:
+        number = int(item["number"])
+    except (KeyError, TypeError, ValueError):
+        return None
+    if number < 1:
+        return None
+    
+    name = item.get("name")
+    return Channel(number, str(name) if name else None, bool(item.get("favorite", False)))
@@ -0,0 +1,331 @@
+"""Typed command registry for the SmartThings API.
+
+Every key the integration can send is declared once below as a frozen
+descriptor, including its pre-serialized body and, for keys offered as
+buttons, its button metadata. ``SMARTTHINGS_COMMANDS``,
+``ALL_BUTTON_COMMANDS`` and ``KEY_NAMES``, the keys the services accept,
+are generated from it once at import, with ``KEY_SET`` for lookups.
+"""
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field, replace
+from typing import Any, Final, NamedTuple
+
+from homeassistant.helpers.json import json_bytes
+
+from .capabilities import MAIN_COMPONENT
+
+BODY_PREFIX: Final = b'{"commands":['
+BODY_SUFFIX: Final = b"]}"
+
+REMOTE_CONTROL: Final = "samsungvd.remoteControl"
+
+# Button groups, in the order their buttons are created. The group is
+# part of the button's unique ID.
+GROUP_NAVIGATION: Final = "nav"
+GROUP_PLAYBACK: Final = "playback"
+GROUP_CHANNEL: Final = "channel"
+GROUP_NUMBER: Final = "num"
+GROUP_COLOR: Final = "color"
+GROUP_SPECIAL: Final = "special"
+GROUP_VOLUME: Final = "volume"
+BUTTON_GROUPS: Final = (
+    GROUP_NAVIGATION,
+    GROUP_PLAYBACK,
+    GROUP_CHANNEL,
+    GROUP_NUMBER,
+    GROUP_COLOR,
+    GROUP_SPECIAL,
+    GROUP_VOLUME,
+)
+
+# Keys that switch between two commands by the last known state
+POWER_TOGGLE: Final = "POWER"
+
+
+class CommandBody:
+    """Pre-serialized request body for one SmartThings command.
+    
+    The static part of the payload is encoded once; only the arguments are
+    serialized per request, and argument-less bodies are fully cached.
+    """
+    
+    __slots__ = ("_prefix", "static")
+    
+    def __init__(self, component: str, capability: str, command: str, args: list[Any]) -> None:
+        """Encode the command envelope."""
+        head = json_bytes(
+            {"component": component, "capability": capability, "command": command}
+        )
+        self._prefix = BODY_PREFIX + head[:-1] + b',"arguments":'
+        self.static = self.render(args)
+    
+    def render(self, args: list[Any]) -> bytes:
+        """Return the body with the given arguments."""
+        return self._prefix + json_bytes(args) + b"}" + BODY_SUFFIX
+    
+    @property
+    def command(self) -> bytes:
+        """Return the static command object without the envelope."""
+        return self.static[len(BODY_PREFIX):-len(BODY_SUFFIX)]
+
+
+class ButtonInfo(NamedTuple):
+    """How a key is offered as a button entity."""
+    
+    name: str
+    icon: str
+    group: str
+
+
+@dataclass(frozen=True, slots=True)
+class CommandDescriptor:
+    """A validated SmartThings command."""
+    
+    name: str
+    component: str
+    capability: str
+    command: str
+    args: tuple[Any, ...] = ()
+    button: ButtonInfo | None = field(default=None, compare=False)
+    # Setters need an argument when sent and are not offered as keys
+    setter: bool = field(default=False, compare=False)
+    body: CommandBody = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        """Validate the descriptor and encode its body."""
+        for attr in ("name", "component", "capability", "command"):
+            if not isinstance(value := getattr(self, attr), str) or not value:
+                raise ValueError(f"Command {self.name!r} has an invalid {attr}: {value!r}")
+        object.__setattr__(
+            self,
+            "body",
+            CommandBody(self.component, self.capability, self.command, list(self.args)),
+        )
+    
+    def as_config(self) -> dict[str, Any]:
+        """Return the command in the ``SMARTTHINGS_COMMANDS`` format."""
+        return {
+            "component": self.component,
+            "capability": self.capability,
+            "command": self.command,
+            "args": list(self.args),
+        }
+    
+    def for_component(self, component: str) -> CommandDescriptor:
+        """Return the command addressed to another component."""
+        if component == self.component:
+            return self
+        return replace(self, component=component)
+    
+    def render(self, *args: Any) -> bytes:
+        """Return the request body, using the cached one without arguments."""
+        if not args:
+            return self.body.static
+        return self.body.render(list(args))
+
+
+class CommandAlias(NamedTuple):
+    """Another name for a command, optionally with a button of its own."""
+    
+    name: str
+    target: str
+    button: ButtonInfo | None = None
+
+
+def render_batch(descriptors: Iterable[CommandDescriptor]) -> bytes:
+    """Return one request body sending several static commands in order."""
+    return BODY_PREFIX + b",".join(d.body.command for d in descriptors) + BODY_SUFFIX
+
+
+def _key(name: str, key: str | None = None, button: ButtonInfo | None = None) -> CommandDescriptor:
+    """Return a remote control key press."""
+    return CommandDescriptor(name, MAIN_COMPONENT, REMOTE_CONTROL, "send", (key or name,), button)
+
+
+def _capability(
+    name: str, capability: str, command: str, button: ButtonInfo | None = None
+) -> CommandDescriptor:
+    """Return a capability command without arguments."""
+    return CommandDescriptor(name, MAIN_COMPONENT, capability, command, (), button)
+
+
+def _setter(name: str, capability: str, command: str) -> CommandDescriptor:
+    """Return a capability command whose argument is passed when rendering."""
+    return CommandDescriptor(name, MAIN_COMPONENT, capability, command, (), setter=True)
+
+
+REGISTRY: Final[tuple[CommandDescriptor | CommandAlias, ...]] = (
+    # Power. POWER toggles between the two by the last known power state.
+    _capability("POWER_ON", "switch", "on"),
+    _capability("POWER_OFF", "switch", "off"),
+    
+    # Navigation
+    _key("UP", button=ButtonInfo("Up", "mdi:chevron-up", GROUP_NAVIGATION)),
+    _key("DOWN", button=ButtonInfo("Down", "mdi:chevron-down", GROUP_NAVIGATION)),
+    _key("LEFT", button=ButtonInfo("Left", "mdi:chevron-left", GROUP_NAVIGATION)),
+    _key("RIGHT", button=ButtonInfo("Right", "mdi:chevron-right", GROUP_NAVIGATION)),
+    _key("OK", button=ButtonInfo("OK", "mdi:checkbox-marked-circle", GROUP_NAVIGATION)),
+    CommandAlias("ENTER", "OK", ButtonInfo("Enter", "mdi:keyboard-return", GROUP_NAVIGATION)),
+    _key("BACK", button=ButtonInfo("Back", "mdi:arrow-left", GROUP_NAVIGATION)),
+    _key("HOME", button=ButtonInfo("Home", "mdi:home", GROUP_NAVIGATION)),
+    _key("MENU", button=ButtonInfo("Menu", "mdi:menu", GROUP_NAVIGATION)),
+    _key("EXIT", button=ButtonInfo("Exit", "mdi:exit-to-app", GROUP_NAVIGATION)),
+    
+    # Volume
+    _capability("MUTE", "audioMute", "mute"),
+    _capability("UNMUTE", "audioMute", "unmute"),
+    _capability(
+        "VOLUME_UP",
+        "audioVolume",
+        "volumeUp",
+        ButtonInfo("Volume Up", "mdi:volume-plus", GROUP_VOLUME),
+    ),
+    _capability(
+        "VOLUME_DOWN",
+        "audioVolume",
+        "volumeDown",
+        ButtonInfo("Volume Down", "mdi:volume-minus", GROUP_VOLUME),
+    ),
+    _setter("SET_VOLUME", "audioVolume", "setVolume"),
+    
+    # Playback
+    _capability("PLAY", "mediaPlayback", "play", ButtonInfo("Play", "mdi:play", GROUP_PLAYBACK)),
+    _capability(
+        "PAUSE", "mediaPlayback", "pause", ButtonInfo("Pause", "mdi:pause", GROUP_PLAYBACK)
+    ),
+    _capability("STOP", "mediaPlayback", "stop", ButtonInfo("Stop", "mdi:stop", GROUP_PLAYBACK)),
+    _capability(
+        "REWIND", "mediaPlayback", "rewind", ButtonInfo("Rewind", "mdi:rewind", GROUP_PLAYBACK)
+    ),
+    CommandAlias(
+        "FF", "FAST_FORWARD", ButtonInfo("Fast Forward", "mdi:fast-forward", GROUP_PLAYBACK)
+    ),
+    _capability(
+        "FAST_FORWARD",
+        "mediaPlayback",
+        "fastForward",
+        ButtonInfo("Fast Forward", "mdi:fast-forward", GROUP_PLAYBACK),
+    ),
+    
+    # Source
+    _key("HDMI"),
+    _key("HDMI1"),
+    _key("HDMI2"),
+    _key("HDMI3"),
+    _key("HDMI4"),
+    _setter("SET_INPUT_SOURCE", "mediaInputSource", "setInputSource"),
+    _setter("SET_SAMSUNG_INPUT_SOURCE", "samsungvd.mediaInputSource", "setInputSource"),
+    
+    # Apps
+    _setter("LAUNCH_APP", "custom.launchapp", "launchApp"),
+    
+    # Channel
+    _capability(
+        "CHANNEL_UP",
+        "tvChannel",
+        "channelUp",
+        ButtonInfo("Channel Up", "mdi:chevron-up-box", GROUP_CHANNEL),
+    ),
+    _capability(
+        "CHANNEL_DOWN",
+        "tvChannel",
+        "channelDown",
+        ButtonInfo("Channel Down", "mdi:chevron-down-box", GROUP_CHANNEL),
+    ),
+    _key("PRECH", button=ButtonInfo("Previous Channel", "mdi:history", GROUP_CHANNEL)),
+    _key("CH_LIST", button=ButtonInfo("Channel List", "mdi:format-list-numbered", GROUP_CHANNEL)),
+    _setter("SET_CHANNEL", "tvChannel", "setTvChannel"),
+    
+    # Numbers
+    *(
+        _key(digit, button=ButtonInfo(digit, f"mdi:numeric-{digit}-box", GROUP_NUMBER))
+        for digit in "0123456789"
+    ),
+    
+    # Color buttons
+    _key("RED", button=ButtonInfo("Red", "mdi:alpha-r-box", GROUP_COLOR)),
+    _key("GREEN", button=ButtonInfo("Green", "mdi:alpha-g-box", GROUP_COLOR)),
+    _key("YELLOW", button=ButtonInfo("Yellow", "mdi:alpha-y-box", GROUP_COLOR)),
+    _key("BLUE", button=ButtonInfo("Blue", "mdi:alpha-b-box", GROUP_COLOR)),
+    
+    # Special. The settings menu opens with the MENU key on Tizen.
+    _key("GUIDE", button=ButtonInfo("Guide", "mdi:television-guide", GROUP_SPECIAL)),
+    _key("INFO", button=ButtonInfo("Info", "mdi:information", GROUP_SPECIAL)),
+    _key("TOOLS", button=ButtonInfo("Tools", "mdi:tools", GROUP_SPECIAL)),
+    CommandAlias("SETTINGS", "MENU", ButtonInfo("Settings", "mdi:cog", GROUP_SPECIAL)),
+    _key("SOURCE", button=ButtonInfo("Source", "mdi:import", GROUP_SPECIAL)),
+)
+
+# Commands that differ on some models, by model number prefix. Entries
+# replace the registry command of the same name on matching devices.
+MODEL_OVERRIDES: Final[dict[str, tuple[CommandDescriptor, ...]]] = {}
+
+
+def _build_commands(
+    registry: Iterable[CommandDescriptor | CommandAlias],
+) -> dict[str, CommandDescriptor]:
+    """Return the commands by name, with aliases resolved to their target."""
+    commands: dict[str, CommandDescriptor] = {}
+    aliases: list[CommandAlias] = []
+    for entry in registry:
+        if isinstance(entry, CommandAlias):
+            aliases.append(entry)
+        elif entry.name in commands:
+            raise ValueError(f"Duplicate command {entry.name!r}")
+        else:
+            commands[entry.name] = entry
+    
+    for alias in aliases:
+        if alias.name in commands or alias.target not in commands:
+            raise ValueError(f"Invalid alias {alias.name!r} for {alias.target!r}")
+        commands[alias.name] = commands[alias.target]
+    return commands
+
+
+def _build_buttons(
+    registry: Iterable[CommandDescriptor | CommandAlias],
+) -> dict[str, ButtonInfo]:
+    """Return the button metadata by key, ordered by button group."""
+    buttons = [(entry.name, entry.button) for entry in registry if entry.button is not None]
+    buttons.sort(key=lambda item: BUTTON_GROUPS.index(item[1].group))
+    return dict(buttons)
+
+
+COMMANDS: Final[dict[str, CommandDescriptor]] = _build_commands(REGISTRY)
+
+# Generated views of the registry
+SMARTTHINGS_COMMANDS: Final[dict[str, dict[str, Any]]] = {
+    name: descriptor.as_config() for name, descriptor in COMMANDS.items()
+}
+ALL_BUTTON_COMMANDS: Final[dict[str, ButtonInfo]] = _build_buttons(REGISTRY)
+# Keys accepted by the services, the remote entity and the websocket API
+KEY_NAMES: Final[tuple[str, ...]] = (
+    POWER_TOGGLE,
+    *(name for name, descriptor in COMMANDS.items() if not descriptor.setter),
+)
+# Constant-time membership checks for every key press
+KEY_SET: Final[frozenset[str]] = frozenset(KEY_NAMES)
+
+
+def commands_for_model(model: str | None) -> dict[str, CommandDescriptor]:
+    """Return the commands with the overrides for a model applied."""
+    if not model:
+        return COMMANDS
+    overrides = [
+        descriptor
+        for prefix, descriptors in MODEL_OVERRIDES.items()
+        if model.startswith(prefix)
+        for descriptor in descriptors
+    ]
+    if not overrides:
+        return COMMANDS
+    return {**COMMANDS, **{descriptor.name: descriptor for descriptor in overrides}}
+
+
+def lookup(commands: Mapping[str, CommandDescriptor], name: str) -> CommandDescriptor | None:
+    """Return a command by name in any case, without re-casing upper-case names."""
+    if (descriptor := commands.get(name)) is not None:
+        return descriptor
+    return commands.get(name.upper())
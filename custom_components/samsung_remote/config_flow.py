@@ -9,8 +9,20 @@ import voluptuous as vol
 from homeassistant import config_entries
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
+from homeassistant.helpers import config_validation as cv
 
-from .const import DOMAIN, CONF_DEVICE_ID, CONF_DEVICE_NAME, CONF_SMARTTHINGS_ENTRY_ID
+from .commands import ALL_BUTTON_COMMANDS
+from .const import (
+    DOMAIN,
+    BUTTON_MODE_ALL,
+    BUTTON_MODE_COMPACT,
+    CONF_BUTTON_MODE,
+    CONF_BUTTONS,
+    CONF_DEVICE_ID,
+    CONF_DEVICE_NAME,
+    CONF_SMARTTHINGS_ENTRY_ID,
+    DEFAULT_BUTTON_MODE,
+)
 from .smartthings_bridge import get_samsung_tvs_from_api, get_smartthings_token
 
 _LOGGER = logging.getLogger(__name__)
@@ -37,7 +49,7 @@ class SamsungRemoteConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         """Initialize the config flow."""
         self._smartthings_entries: list[config_entries.ConfigEntry] = []
         self._selected_smartthings_entry: config_entries.ConfigEntry | None = None
-        self._available_tvs: list[dict[str, str]] = []
+        self._available_tvs: list[dict[str, Any]] = []
     
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
@@ -169,12 +181,23 @@ class SamsungRemoteOptionsFlow(config_entries.OptionsFlow):
         if user_input is not None:
             return self.async_create_entry(title="", data=user_input)
         
+        options = self.config_entry.options
         return self.async_show_form(
             step_id="init",
             data_schema=vol.Schema({
                 vol.Optional(
                     "scan_interval",
-                    default=self.config_entry.options.get("scan_interval", 30),
+                    default=options.get("scan_interval", 30),
                 ): vol.All(vol.Coerce(int), vol.Range(min=10, max=300)),
+                vol.Optional(
+                    CONF_BUTTON_MODE,
+                    default=options.get(CONF_BUTTON_MODE, DEFAULT_BUTTON_MODE),
+                ): vol.In([BUTTON_MODE_ALL, BUTTON_MODE_COMPACT]),
+                vol.Optional(
+                    CONF_BUTTONS,
+                    default=options.get(CONF_BUTTONS, []),
+                ): cv.multi_select(
+                    {cmd: button.name for cmd, button in ALL_BUTTON_COMMANDS.items()}
+                ),
             }),
         )
@@ -11,162 +11,69 @@ CONF_SMARTTHINGS_ENTRY_ID: Final = "smartthings_entry_id"
 # SmartThings API
 SMARTTHINGS_API_BASE: Final = "https://api.smartthings.com/v1"
 
-
-# Navigation Button Commands
-NAVIGATION_COMMANDS: Final = {
-    "UP": {"icon": "mdi:chevron-up", "name": "Up"},
-    "DOWN": {"icon": "mdi:chevron-down", "name": "Down"},
-    "LEFT": {"icon": "mdi:chevron-left", "name": "Left"},
-    "RIGHT": {"icon": "mdi:chevron-right", "name": "Right"},
-    "OK": {"icon": "mdi:checkbox-marked-circle", "name": "OK"},
-    "ENTER": {"icon": "mdi:keyboard-return", "name": "Enter"},
-    "BACK": {"icon": "mdi:arrow-left", "name": "Back"},
-    "HOME": {"icon": "mdi:home", "name": "Home"},
-    "MENU": {"icon": "mdi:menu", "name": "Menu"},
-    "EXIT": {"icon": "mdi:exit-to-app", "name": "Exit"},
-}
-
-# Playback Button Commands
-PLAYBACK_COMMANDS: Final = {
-    "PLAY": {"icon": "mdi:play", "name": "Play"},
-    "PAUSE": {"icon": "mdi:pause", "name": "Pause"},
-    "STOP": {"icon": "mdi:stop", "name": "Stop"},
-    "REWIND": {"icon": "mdi:rewind", "name": "Rewind"},
-    "FF": {"icon": "mdi:fast-forward", "name": "Fast Forward"},
-    "FAST_FORWARD": {"icon": "mdi:fast-forward", "name": "Fast Forward"},
-}
-
-# Channel Button Commands
-CHANNEL_COMMANDS: Final = {
-    "CHANNEL_UP": {"icon": "mdi:chevron-up-box", "name": "Channel Up"},
-    "CHANNEL_DOWN": {"icon": "mdi:chevron-down-box", "name": "Channel Down"},
-    "PRECH": {"icon": "mdi:history", "name": "Previous Channel"},
-    "CH_LIST": {"icon": "mdi:format-list-numbered", "name": "Channel List"},
-}
-
-# Number Pad Commands
-NUMBER_COMMANDS: Final = {
-    "0": {"icon": "mdi:numeric-0-box", "name": "0"},
-    "1": {"icon": "mdi:numeric-1-box", "name": "1"},
-    "2": {"icon": "mdi:numeric-2-box", "name": "2"},
-    "3": {"icon": "mdi:numeric-3-box", "name": "3"},
-    "4": {"icon": "mdi:numeric-4-box", "name": "4"},
-    "5": {"icon": "mdi:numeric-5-box", "name": "5"},
-    "6": {"icon": "mdi:numeric-6-box", "name": "6"},
-    "7": {"icon": "mdi:numeric-7-box", "name": "7"},
-    "8": {"icon": "mdi:numeric-8-box", "name": "8"},
-    "9": {"icon": "mdi:numeric-9-box", "name": "9"},
-}
-
-# Color Button Commands
-COLOR_COMMANDS: Final = {
-    "RED": {"icon": "mdi:alpha-r-box", "name": "Red"},
-    "GREEN": {"icon": "mdi:alpha-g-box", "name": "Green"},
-    "YELLOW": {"icon": "mdi:alpha-y-box", "name": "Yellow"},
-    "BLUE": {"icon": "mdi:alpha-b-box", "name": "Blue"},
-}
-
-# Special Button Commands
-SPECIAL_COMMANDS: Final = {
-    "GUIDE": {"icon": "mdi:television-guide", "name": "Guide"},
-    "INFO": {"icon": "mdi:information", "name": "Info"},
-    "TOOLS": {"icon": "mdi:tools", "name": "Tools"},
-    "SETTINGS": {"icon": "mdi:cog", "name": "Settings"},
-    "SOURCE": {"icon": "mdi:import", "name": "Source"},
-}
-
-# Volume Commands (for buttons, switch handles mute)
-VOLUME_COMMANDS: Final = {
-    "VOLUME_UP": {"icon": "mdi:volume-plus", "name": "Volume Up"},
-    "VOLUME_DOWN": {"icon": "mdi:volume-minus", "name": "Volume Down"},
-}
-
-# HDMI Source Options
+# Request timeouts in seconds (per operation)
+TIMEOUT_COMMAND: Final = 5
+TIMEOUT_STATUS: Final = 10
+TIMEOUT_DISCOVERY: Final = 30
+
+# Status reads within this many seconds reuse the last fetched document
+STATUS_MAX_AGE: Final = 0.5
+
+# Seconds after a command until the changed capability is read back.
+# Further commands on the capability within this window restart it.
+CONFIRM_DELAY: Final = 0.75
+
+# Seconds the cloud may keep reporting the old power state while the TV
+# wakes up or shuts down. The requested state is kept for this long and
+# the power state is only read back afterwards.
+POWER_GRACE: Final = 15
+
+# Keep-warm (seconds). aiohttp closes pooled connections idle for 15 s, so
+# a cheap request every KEEP_WARM_INTERVAL keeps one open for
+# KEEP_WARM_WINDOW after the last command. Slower requests count as slow.
+KEEP_WARM_INTERVAL: Final = 12
+KEEP_WARM_WINDOW: Final = 300
+HEALTH_SLOW_LATENCY: Final = 2.0
+
+# Number entities send the first change at once and then at most one
+# further change, the latest, per cooldown (seconds)
+NUMBER_DEBOUNCE_COOLDOWN: Final = 0.5
+
+# Ring buffer sizes for diagnostics traces
+TRACE_REQUESTS: Final = 50
+TRACE_SNAPSHOTS: Final = 10
+
+# Press-and-hold key repeat (seconds). HOLD_MIN_INTERVAL caps held keys at
+# a rate the SmartThings command budget can sustain. A hold ends HOLD_LEASE
+# after the last press_start unless renewed, and after HOLD_MAX_DURATION.
+HOLD_INITIAL_DELAY: Final = 0.5
+HOLD_REPEAT_INTERVAL: Final = 0.4
+HOLD_MIN_INTERVAL: Final = 0.25
+HOLD_ACCELERATION: Final = 1.15
+HOLD_MAX_DURATION: Final = 30
+HOLD_LEASE: Final = 2.0
+HOLD_VOLUME_UPDATE_INTERVAL: Final = 0.5
+
+# Group operations (seconds). TVs of one SmartThings account are started
+# FLEET_STAGGER apart; failed TVs are retried with a doubling delay.
+FLEET_STAGGER: Final = 0.25
+FLEET_RETRIES: Final = 2
+FLEET_RETRY_DELAY: Final = 1.0
+
+
+# HDMI Source Options, used when the TV does not report its input sources
 HDMI_SOURCES: Final = ["HDMI", "HDMI1", "HDMI2", "HDMI3", "HDMI4"]
 
-# All button commands combined
-ALL_BUTTON_COMMANDS: Final = {
-    **NAVIGATION_COMMANDS,
-    **PLAYBACK_COMMANDS,
-    **CHANNEL_COMMANDS,
-    **NUMBER_COMMANDS,
-    **COLOR_COMMANDS,
-    **SPECIAL_COMMANDS,
-    **VOLUME_COMMANDS,
-}
-
-# Supported commands for SmartThings API
-SMARTTHINGS_COMMANDS: Final = {
-    # Navigation
-    "UP": {"component": "main", "capability": "samsungvd.remoteControl", "command": "send", "args": ["UP"]},
-    "DOWN": {"component": "main", "capability": "samsungvd.remoteControl", "command": "send", "args": ["DOWN"]},
-    "LEFT": {"component": "main", "capability": "samsungvd.remoteControl", "command": "send", "args": ["LEFT"]},
-    "RIGHT": {"component": "main", "capability": "samsungvd.remoteControl", "command": "send", "args": ["RIGHT"]},
-    "OK": {"component": "main", "capability": "samsungvd.remoteControl", "command": "send", "args": ["OK"]},
-    "ENTER": {"component": "main", "capability": "samsungvd.remoteControl", "command": "send", "args": ["OK"]},
-    "BACK": {"component": "main", "capability": "samsungvd.remoteControl", "command": "send", "args": ["BACK"]},
-    "HOME": {"component": "main", "capability": "samsungvd.remoteControl", "command": "send", "args": ["HOME"]},
-    "MENU": {"component": "main", "capability": "samsungvd.remoteControl", "command": "send", "args": ["MENU"]},
-    "EXIT": {"component": "main", "capability": "samsungvd.remoteControl", "command": "send", "args": ["EXIT"]},
-    
-    # Volume
-    "MUTE": {"component": "main", "capability": "audioMute", "command": "mute", "args": []},
-    "UNMUTE": {"component": "main", "capability": "audioMute", "command": "unmute", "args": []},
-    "VOLUME_UP": {"component": "main", "capability": "audioVolume", "command": "volumeUp", "args": []},
-    "VOLUME_DOWN": {"component": "main", "capability": "audioVolume", "command": "volumeDown", "args": []},
-    "SET_VOLUME": {"component": "main", "capability": "audioVolume", "command": "setVolume", "args": []},
-    
-    # Playback
-    "PLAY": {"component": "main", "capability": "mediaPlayback", "command": "play", "args": []},
-    "PAUSE": {"component": "main", "capability": "mediaPlayback", "command": "pause", "args": []},
-    "STOP": {"component": "main", "capability": "mediaPlayback", "command": "stop", "args": []},
-    "REWIND": {"component": "main", "capability": "mediaPlayback", "command": "rewind", "args": []},
-    "FF": {"component": "main", "capability": "mediaPlayback", "command": "fastForward", "args": []},
-    "FAST_FORWARD": {"component": "main", "capability": "mediaPlayback", "command": "fastForward", "args": []},
-    
-    # Power
-    "POWER": {"component": "main", "capability": "switch", "command": "off", "args": []},
-    "POWER_ON": {"component": "main", "capability": "switch", "command": "on", "args": []},
-    "POWER_OFF": {"component": "main", "capability": "switch", "command": "off", "args": []},
-    
-    # Source
-    "SOURCE": {"component": "main", "capability": "samsungvd.remoteControl", "command": "send", "args": ["SOURCE"]},
-    "HDMI": {"component": "main", "capability": "samsungvd.remoteControl", "command": "send", "args": ["HDMI"]},
-    "HDMI1": {"component": "main", "capability": "samsungvd.remoteControl", "command": "send", "args": ["HDMI1"]},
-    "HDMI2": {"component": "main", "capability": "samsungvd.remoteControl", "command": "send", "args": ["HDMI2"]},
-    "HDMI3": {"component": "main", "capability": "samsungvd.remoteControl", "command": "send", "args": ["HDMI3"]},
-    "HDMI4": {"component": "main", "capability": "samsungvd.remoteControl", "command": "send", "args": ["HDMI4"]},
-    
-    # Channel
-    "CHANNEL_UP": {"component": "main", "capability": "tvChannel", "command": "channelUp", "args": []},
-    "CHANNEL_DOWN": {"component": "main", "capability": "tvChannel", "command": "channelDown", "args": []},
-    "PRECH": {"component": "main", "capability": "samsungvd.remoteControl", "command": "send", "args": ["PRECH"]},
-    "CH_LIST": {"component": "main", "capability": "samsungvd.remoteControl", "command": "send", "args": ["CH_LIST"]},
-    "SET_CHANNEL": {"component": "main", "capability": "tvChannel", "command": "setTvChannel", "args": []},
-    
-    # Numbers
-    "0": {"component": "main", "capability": "samsungvd.remoteControl", "command": "send", "args": ["0"]},
-    "1": {"component": "main", "capability": "samsungvd.remoteControl", "command": "send", "args": ["1"]},
-    "2": {"component": "main", "capability": "samsungvd.remoteControl", "command": "send", "args": ["2"]},
-    "3": {"component": "main", "capability": "samsungvd.remoteControl", "command": "send", "args": ["3"]},
-    "4": {"component": "main", "capability": "samsungvd.remoteControl", "command": "send", "args": ["4"]},
-    "5": {"component": "main", "capability": "samsungvd.remoteControl", "command": "send", "args": ["5"]},
-    "6": {"component": "main", "capability": "samsungvd.remoteControl", "command": "send", "args": ["6"]},
-    "7": {"component": "main", "capability": "samsungvd.remoteControl", "command": "send", "args": ["7"]},
-    "8": {"component": "main", "capability": "samsungvd.remoteControl", "command": "send", "args": ["8"]},
-    "9": {"component": "main", "capability": "samsungvd.remoteControl", "command": "send", "args": ["9"]},
-    
-    # Color buttons
-    "RED": {"component": "main", "capability": "samsungvd.remoteControl", "command": "send", "args": ["RED"]},
-    "GREEN": {"component": "main", "capability": "samsungvd.remoteControl", "command": "send", "args": ["GREEN"]},
-    "YELLOW": {"component": "main", "capability": "samsungvd.remoteControl", "command": "send", "args": ["YELLOW"]},
-    "BLUE": {"component": "main", "capability": "samsungvd.remoteControl", "command": "send", "args": ["BLUE"]},
-    
-    # Special
-    "GUIDE": {"component": "main", "capability": "samsungvd.remoteControl", "command": "send", "args": ["GUIDE"]},
-    "INFO": {"component": "main", "capability": "samsungvd.remoteControl", "command": "send", "args": ["INFO"]},
-    "TOOLS": {"component": "main", "capability": "samsungvd.remoteControl", "command": "send", "args": ["TOOLS"]},
-    "SETTINGS": {"component": "main", "capability": "samsungvd.remoteControl", "command": "send", "args": ["MENU"]},
+# Tizen app IDs of common apps. SmartThings does not list installed apps,
+# so these are offered for direct launch.
+KNOWN_APPS: Final = {
+    "Netflix": "3201907018807",
+    "YouTube": "111299001912",
+    "Prime Video": "3201910019365",
+    "Disney+": "3201901017640",
+    "Apple TV": "3201807016597",
+    "Spotify": "3201606009684",
+    "Plex": "3201512006963",
 }
 
 # Activity list for remote entity
@@ -174,3 +81,15 @@ ACTIVITIES: Final = ["watching_tv", "streaming", "gaming"]
 
 # Default scan interval in seconds
 DEFAULT_SCAN_INTERVAL: Final = 30
+
+# While the TV is off only its power state is polled, at this interval
+OFF_SCAN_INTERVAL: Final = 60
+
+# Button entity options: "all" creates one button per key, "compact" only
+# the keys listed in CONF_BUTTONS; other keys go through the remote entity
+# and the keypad select
+CONF_BUTTON_MODE: Final = "button_mode"
+CONF_BUTTONS: Final = "buttons"
+BUTTON_MODE_ALL: Final = "all"
+BUTTON_MODE_COMPACT: Final = "compact"
+DEFAULT_BUTTON_MODE: Final = BUTTON_MODE_ALL
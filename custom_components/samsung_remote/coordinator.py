@@ -0,0 +1,84 @@
+"""Data update coordinator for Samsung TV Remote integration."""
+from __future__ import annotations
+
+from datetime import timedelta
+import logging
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+
+from .const import DOMAIN, OFF_SCAN_INTERVAL, STATUS_MAX_AGE
+from .smartthings_bridge import STATUS_SOURCE_STALE, SmartThingsBridge
+from .snapshot import TVSnapshot
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class SamsungTVCoordinator(DataUpdateCoordinator[TVSnapshot]):
+    """Poll one TV and share its snapshot with all of its entities.
+    
+    While the TV is off only its power state is polled, at a longer
+    interval; full polling resumes once it reports power on or a power on
+    command was sent.
+    """
+    
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        bridge: SmartThingsBridge,
+        scan_interval: int,
+        off_scan_interval: int = OFF_SCAN_INTERVAL,
+    ) -> None:
+        """Initialize the coordinator."""
+        self._on_interval = timedelta(seconds=scan_interval)
+        self._off_interval = timedelta(seconds=max(scan_interval, off_scan_interval))
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=f"{DOMAIN} {bridge.device_id}",
+            update_interval=self._on_interval,
+            # Snapshots compare by value, so unchanged polls write no state
+            always_update=False,
+        )
+        self.bridge = bridge
+        self._refreshing = False
+        self._unsub_bridge = bridge.async_add_listener(self._async_bridge_snapshot)
+    
+    async def _async_update_data(self) -> TVSnapshot:
+        """Fetch the latest snapshot."""
+        self._refreshing = True
+        try:
+            max_age = STATUS_MAX_AGE
+            if self.data is not None and not self.bridge.snapshot.power:
+                power = await self.bridge.async_read_power()
+                if power is None:
+                    raise UpdateFailed("Failed to get power state from SmartThings")
+                if not power:
+                    return self._async_track_power(self.bridge.snapshot)
+                # Turned on: the cached status still describes the TV as off
+                max_age = 0
+            read = await self.bridge.async_read_status(max_age)
+        finally:
+            self._refreshing = False
+        
+        if read.source == STATUS_SOURCE_STALE:
+            raise UpdateFailed("Failed to get device status from SmartThings")
+        return self._async_track_power(self.bridge.snapshot)
+    
+    @callback
+    def _async_track_power(self, snapshot: TVSnapshot) -> TVSnapshot:
+        """Poll at the interval matching the power state of a snapshot."""
+        self.update_interval = self._on_interval if snapshot.power else self._off_interval
+        return snapshot
+    
+    @callback
+    def _async_bridge_snapshot(self, snapshot: TVSnapshot) -> None:
+        """Take snapshots fetched outside of the polling cycle."""
+        if not self._refreshing:
+            # Setting the data reschedules polling with the new interval
+            self.async_set_updated_data(self._async_track_power(snapshot))
+    
+    async def async_shutdown(self) -> None:
+        """Stop polling and listening to the bridge."""
+        self._unsub_bridge()
+        await super().async_shutdown()
@@ -0,0 +1,72 @@
+"""Diagnostics support for Samsung TV Remote integration."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN, CONF_DEVICE_ID, CONF_SMARTTHINGS_ENTRY_ID
+
+TO_REDACT = {
+    CONF_DEVICE_ID,
+    CONF_SMARTTHINGS_ENTRY_ID,
+    "deviceId",
+    "hubId",
+    "locationId",
+    "ownerId",
+    "roomId",
+}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    data = hass.data[DOMAIN][entry.entry_id]
+    bridge = data["bridge"]
+    coordinator = data["coordinator"]
+    device_info = bridge.device_info
+    
+    return {
+        "entry": {
+            "data": async_redact_data(entry.data, TO_REDACT),
+            "options": dict(entry.options),
+        },
+        "device": async_redact_data(
+            {key: value for key, value in device_info.items() if key != "components"},
+            TO_REDACT,
+        ),
+        "capabilities": {
+            component: sorted(bridge.capabilities.capabilities(component))
+            for component in bridge.capabilities.components
+        },
+        "snapshot": bridge.snapshot.as_dict(),
+        "channels": {
+            "imported": bridge.channels.imported,
+            "known": len(bridge.channels.channels),
+            "favorites": len(bridge.channels.favorites),
+        },
+        "polling": {
+            "update_interval": coordinator.update_interval.total_seconds()
+            if coordinator.update_interval
+            else None,
+            "last_update_success": coordinator.last_update_success,
+            "last_exception": repr(coordinator.last_exception)
+            if coordinator.last_exception
+            else None,
+        },
+        "key_queue": {
+            "pending": bridge.key_queue_depth,
+            "held_keys": data["hold"].held_keys,
+        },
+        "connection": {
+            "health": bridge.health.state,
+            "latency": bridge.health.latency,
+            "failures": bridge.health.failures,
+            "keep_warm": bridge.health.keeping_warm,
+        },
+        "traces": bridge.tracer.as_dict(),
+        "profile": bridge.profiler.as_dict(),
+    }
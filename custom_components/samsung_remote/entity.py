@@ -0,0 +1,148 @@
+"""Base entity for Samsung TV Remote integration."""
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+import logging
+import time
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.entity import DeviceInfo, Entity
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .const import DOMAIN
+from .coordinator import SamsungTVCoordinator
+from .hold import HoldController
+from .profiler import STAGE_ENTITY_WRITE
+from .smartthings_bridge import SmartThingsBridge
+from .snapshot import TVSnapshot
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class SamsungTVContext:
+    """Objects shared by all entities of one TV."""
+    
+    entry_id: str
+    device_id: str
+    bridge: SmartThingsBridge
+    coordinator: SamsungTVCoordinator
+    hold: HoldController
+    device_info: DeviceInfo
+    
+    @classmethod
+    def create(
+        cls,
+        entry_id: str,
+        device_id: str,
+        device_name: str,
+        bridge: SmartThingsBridge,
+        coordinator: SamsungTVCoordinator,
+        hold: HoldController,
+    ) -> SamsungTVContext:
+        """Create the context, building the device info once."""
+        return cls(
+            entry_id=entry_id,
+            device_id=device_id,
+            bridge=bridge,
+            coordinator=coordinator,
+            hold=hold,
+            device_info=DeviceInfo(
+                identifiers={(DOMAIN, device_id)},
+                name=device_name,
+                manufacturer="Samsung",
+                model="Smart TV",
+            ),
+        )
+
+
+class SamsungTVEntity(CoordinatorEntity[SamsungTVCoordinator]):
+    """Base class for Samsung TV entities.
+    
+    Entities hold a reference to the shared context only and derive their
+    state from the coordinator snapshot in ``_update_from_snapshot``.
+    Entities with ``_requires_power`` show values that are meaningless
+    while the TV is off and are unavailable then.
+    """
+    
+    _attr_has_entity_name = True
+    _requires_power = False
+    
+    def __init__(self, tv: SamsungTVContext, unique_id_suffix: str) -> None:
+        """Initialize the entity."""
+        super().__init__(tv.coordinator)
+        self._tv = tv
+        self._bridge = tv.bridge
+        self._attr_unique_id = f"{tv.device_id}_{unique_id_suffix}"
+        self._attr_device_info = tv.device_info
+        if tv.coordinator.data is not None:
+            self._update_from_snapshot(tv.coordinator.data)
+    
+    @property
+    def available(self) -> bool:
+        """Return if the entity is available."""
+        if not super().available:
+            return False
+        return not self._requires_power or (
+            self.coordinator.data is not None and self.coordinator.data.power
+        )
+    
+    @callback
+    def _update_from_snapshot(self, snapshot: TVSnapshot) -> None:
+        """Update the entity attributes from a snapshot."""
+    
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle a new snapshot from the coordinator."""
+        profiler = self._bridge.profiler
+        started = time.perf_counter() if profiler.enabled else 0.0
+        if self.coordinator.data is not None:
+            self._update_from_snapshot(self.coordinator.data)
+        super()._handle_coordinator_update()
+        if started:
+            profiler.lap(STAGE_ENTITY_WRITE, started)
+
+
+class SamsungTVStatelessEntity(SamsungTVEntity):
+    """Base class for entities whose only state is their availability."""
+    
+    _last_available: bool | None = None
+    
+    async def async_added_to_hass(self) -> None:
+        """Remember the availability written when the entity was added."""
+        await super().async_added_to_hass()
+        self._last_available = self.available
+    
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only when availability changes."""
+        if self.available != self._last_available:
+            profiler = self._bridge.profiler
+            started = time.perf_counter() if profiler.enabled else 0.0
+            self._last_available = self.available
+            self.async_write_ha_state()
+            if started:
+                profiler.lap(STAGE_ENTITY_WRITE, started)
+
+
+@callback
+def async_remove_stale_entities(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    domain: str,
+    entities: Iterable[Entity],
+) -> None:
+    """Remove registry entries of a platform that are no longer created.
+    
+    Keeps the registry from filling up with orphaned entries when options
+    reduce the set of entities, e.g. when switching to compact buttons.
+    """
+    unique_ids = {entity.unique_id for entity in entities}
+    registry = er.async_get(hass)
+    for entity_entry in er.async_entries_for_config_entry(registry, entry.entry_id):
+        if entity_entry.domain == domain and entity_entry.unique_id not in unique_ids:
+            _LOGGER.debug("Removing stale entity %s", entity_entry.entity_id)
+            registry.async_remove(entity_entry.entity_id)
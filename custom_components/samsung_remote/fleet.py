@@ -0,0 +1,121 @@
+"""Group operations across several TVs for Samsung TV Remote integration.
+
+TVs linked through the same SmartThings account share its rate limit, so
+the TVs of one account are started a fixed stagger apart while different
+accounts run in parallel. TVs that fail are retried after the pass, and
+every operation ends with a result per TV.
+"""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass
+import logging
+import time
+from typing import Any
+
+from .const import FLEET_RETRIES, FLEET_RETRY_DELAY, FLEET_STAGGER
+from .smartthings_bridge import SmartThingsBridge
+
+_LOGGER = logging.getLogger(__name__)
+
+# The action run on each TV; it reports success like the bridge methods
+FleetAction = Callable[[SmartThingsBridge], Awaitable[bool]]
+
+
+@dataclass(slots=True)
+class FleetTarget:
+    """One TV of a group operation and its outcome."""
+    
+    entry_id: str
+    name: str
+    bridge: SmartThingsBridge
+    success: bool = False
+    attempts: int = 0
+    error: str | None = None
+    
+    @property
+    def account(self) -> str:
+        """Return the SmartThings entry the TV is linked through."""
+        return self.bridge.smartthings_entry.entry_id
+    
+    def as_dict(self) -> dict[str, Any]:
+        """Return the outcome for the service response."""
+        return {
+            "name": self.name,
+            "success": self.success,
+            "attempts": self.attempts,
+            "error": self.error,
+        }
+
+
+async def _async_attempt(target: FleetTarget, action: FleetAction, delay: float) -> None:
+    """Run the action on one TV after its stagger delay."""
+    if delay:
+        await asyncio.sleep(delay)
+    target.attempts += 1
+    try:
+        target.success = await action(target.bridge)
+    except Exception as err:
+        # One TV must not abort the whole group
+        _LOGGER.error("Group operation failed on %s: %s", target.name, err)
+        target.success = False
+        target.error = repr(err)
+    else:
+        target.error = None if target.success else "command failed"
+
+
+async def _async_run_account(
+    targets: list[FleetTarget], action: FleetAction, stagger: float, retries: int
+) -> None:
+    """Run the action on the TVs of one account, then retry the failed ones."""
+    pending = targets
+    retry_delay = FLEET_RETRY_DELAY
+    for attempt in range(retries + 1):
+        if attempt:
+            await asyncio.sleep(retry_delay)
+            retry_delay *= 2
+        await asyncio.gather(
+            *(
+                _async_attempt(target, action, index * stagger)
+                for index, target in enumerate(pending)
+            )
+        )
+        if not (pending := [target for target in pending if not target.success]):
+            return
+
+
+async def async_run_group(
+    targets: Iterable[FleetTarget],
+    action: FleetAction,
+    stagger: float = FLEET_STAGGER,
+    retries: int = FLEET_RETRIES,
+) -> dict[str, Any]:
+    """Run an action on several TVs and return a summary with a result per TV."""
+    targets = list(targets)
+    accounts: dict[str, list[FleetTarget]] = {}
+    for target in targets:
+        accounts.setdefault(target.account, []).append(target)
+    
+    start = time.monotonic()
+    await asyncio.gather(
+        *(
+            _async_run_account(account_targets, action, stagger, retries)
+            for account_targets in accounts.values()
+        )
+    )
+    succeeded = sum(target.success for target in targets)
+    _LOGGER.info(
+        "Group operation finished on %d of %d TVs in %.1f s",
+        succeeded,
+        len(targets),
+        time.monotonic() - start,
+    )
+    
+    return {
+        "succeeded": succeeded,
+        "failed": len(targets) - succeeded,
+        "accounts": len(accounts),
+        "duration": round(time.monotonic() - start, 3),
+        "results": {target.entry_id: target.as_dict() for target in targets},
+    }
@@ -0,0 +1,145 @@
+"""Connection health and keep-warm for Samsung TV Remote integration.
+
+The first command after a quiet period pays for DNS, TLS and a cold
+connection pool. For a while after a TV was used the monitor keeps its
+account warm: a cheap request keeps one pooled connection open. TVs of
+the same SmartThings account share the connection, so an account is only
+pinged when none of its TVs sent a request recently. The OAuth token is
+left to the SmartThings integration, which owns its refresh.
+"""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from dataclasses import dataclass
+import logging
+import time
+from typing import TYPE_CHECKING
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+
+from .const import (
+    DOMAIN,
+    HEALTH_SLOW_LATENCY,
+    KEEP_WARM_INTERVAL,
+    KEEP_WARM_WINDOW,
+)
+
+if TYPE_CHECKING:
+    from .smartthings_bridge import SmartThingsBridge
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_ACCOUNTS = f"{DOMAIN}_accounts"
+
+# Health states; None until the first request finished
+HEALTH_OK = "ok"
+HEALTH_SLOW = "slow"
+HEALTH_ERROR = "error"
+HEALTH_STATES = [HEALTH_OK, HEALTH_SLOW, HEALTH_ERROR]
+
+
+@dataclass(slots=True)
+class AccountConnection:
+    """Connection state shared by the TVs of one SmartThings account."""
+    
+    last_request: float = 0.0
+
+
+@callback
+def async_get_account(hass: HomeAssistant, account_id: str) -> AccountConnection:
+    """Return the shared connection state of a SmartThings account."""
+    accounts: dict[str, AccountConnection] = hass.data.setdefault(DATA_ACCOUNTS, {})
+    if (account := accounts.get(account_id)) is None:
+        account = accounts[account_id] = AccountConnection()
+    return account
+
+
+class ConnectionMonitor:
+    """Track the connection health of one TV and keep it warm after use."""
+    
+    def __init__(self, bridge: SmartThingsBridge) -> None:
+        """Initialize the connection monitor."""
+        self._bridge = bridge
+        self._account = async_get_account(bridge.hass, bridge.smartthings_entry.entry_id)
+        self._warm_until = 0.0
+        self._task: asyncio.Task | None = None
+        self._listeners: list[Callable[[], None]] = []
+        self.state: str | None = None
+        self.latency: float | None = None
+        self.failures = 0
+    
+    @property
+    def keeping_warm(self) -> bool:
+        """Return True while the keep-warm loop runs."""
+        return self._task is not None
+    
+    @callback
+    def async_add_listener(self, listener: Callable[[], None]) -> CALLBACK_TYPE:
+        """Listen for health changes. Returns a function to remove the listener."""
+        self._listeners.append(listener)
+        
+        @callback
+        def remove_listener() -> None:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+        
+        return remove_listener
+    
+    @callback
+    def _async_notify(self) -> None:
+        """Notify the listeners of a health change."""
+        for listener in list(self._listeners):
+            listener()
+    
+    @callback
+    def async_record_request(self, status: int | None, latency: float) -> None:
+        """Update the health from a finished request.
+        
+        Only transport errors, auth failures and server errors count; a
+        rejected command says nothing about the connection.
+        """
+        self._account.last_request = time.monotonic()
+        self.latency = latency
+        if status is None or status == 401 or status >= 500:
+            self.failures += 1
+            state = HEALTH_ERROR
+        else:
+            self.failures = 0
+            state = HEALTH_SLOW if latency > HEALTH_SLOW_LATENCY else HEALTH_OK
+        if state != self.state:
+            self.state = state
+            self._async_notify()
+    
+    @callback
+    def async_activity(self) -> None:
+        """Keep the connection warm for KEEP_WARM_WINDOW after the TV was used."""
+        self._warm_until = time.monotonic() + KEEP_WARM_WINDOW
+        if self._task is None:
+            self._task = self._bridge.hass.async_create_background_task(
+                self._async_keep_warm(),
+                f"{DOMAIN} keep warm {self._bridge.device_id}",
+            )
+            self._async_notify()
+    
+    async def _async_keep_warm(self) -> None:
+        """Ping the account until the TV was idle for the keep-warm window."""
+        try:
+            while (now := time.monotonic()) < self._warm_until:
+                idle = now - self._account.last_request
+                if idle < KEEP_WARM_INTERVAL:
+                    await asyncio.sleep(KEEP_WARM_INTERVAL - idle)
+                    continue
+                # Claim the ping, so other TVs of the account skip theirs
+                self._account.last_request = now
+                await self._bridge.async_read_capability("switch")
+        finally:
+            self._task = None
+            self._async_notify()
+    
+    @callback
+    def async_shutdown(self) -> None:
+        """Stop keeping the connection warm."""
+        if self._task is not None:
+            self._task.cancel()
+        self._listeners.clear()
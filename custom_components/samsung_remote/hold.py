@@ -0,0 +1,190 @@
+"""Press-and-hold key repeat for Samsung TV Remote integration.
+
+A held navigation key is repeated with an accelerating but rate-limited
+interval. A held volume key never repeats volumeUp/volumeDown; it is turned
+into a computed setVolume target instead.
+
+A hold is a lease: it ends HOLD_LEASE seconds after the last press_start
+for the key unless the client repeats press_start, so a lost press_end
+cannot leave a key repeating.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import TYPE_CHECKING
+
+from homeassistant.core import CALLBACK_TYPE, callback
+
+from .const import (
+    HOLD_ACCELERATION,
+    HOLD_INITIAL_DELAY,
+    HOLD_LEASE,
+    HOLD_MAX_DURATION,
+    HOLD_MIN_INTERVAL,
+    HOLD_REPEAT_INTERVAL,
+    HOLD_VOLUME_UPDATE_INTERVAL,
+)
+
+if TYPE_CHECKING:
+    from .smartthings_bridge import SmartThingsBridge
+
+_LOGGER = logging.getLogger(__name__)
+
+# Held volume keys and the direction of their steps
+VOLUME_KEYS = {"VOLUME_UP": 1, "VOLUME_DOWN": -1}
+
+
+async def _async_wait_release(release: asyncio.Event, timeout: float) -> bool:
+    """Wait up to timeout seconds for the key to be released."""
+    try:
+        await asyncio.wait_for(release.wait(), timeout)
+    except asyncio.TimeoutError:
+        return False
+    return True
+
+
+class HoldController:
+    """Track held keys of one TV and drive their repeats."""
+    
+    def __init__(self, bridge: SmartThingsBridge) -> None:
+        """Initialize the hold controller."""
+        self._bridge = bridge
+        self._releases: dict[str, asyncio.Event] = {}
+        self._tasks: dict[str, asyncio.Task] = {}
+        self._leases: dict[str, float] = {}
+    
+    @property
+    def held_keys(self) -> list[str]:
+        """Return the keys currently held."""
+        return list(self._releases)
+    
+    @callback
+    def async_press_start(
+        self, key: str, acceleration: float = HOLD_ACCELERATION
+    ) -> CALLBACK_TYPE:
+        """Start holding a key, or renew the lease of an already held key.
+        
+        Returns a function that releases this hold, e.g. when the
+        connection that started it closes.
+        """
+        key = key.upper()
+        loop = self._bridge.hass.loop
+        if (release := self._releases.get(key)) is None:
+            release = self._releases[key] = asyncio.Event()
+            self._tasks[key] = self._bridge.hass.async_create_background_task(
+                self._async_hold(key, release, max(acceleration, 1.0)),
+                f"samsung_remote hold {key}",
+            )
+        self._leases[key] = loop.time() + HOLD_LEASE
+        
+        @callback
+        def release_hold() -> None:
+            if self._releases.get(key) is release:
+                self._bridge.hass.async_create_task(self.async_press_end(key))
+        
+        return release_hold
+    
+    def _held(self, key: str, deadline: float) -> bool:
+        """Return True while the hold's lease and maximum duration last."""
+        now = self._bridge.hass.loop.time()
+        return now < deadline and now < self._leases.get(key, 0.0)
+    
+    async def async_press_end(self, key: str) -> None:
+        """Release a held key and wait for its final command."""
+        key = key.upper()
+        if (release := self._releases.pop(key, None)) is None:
+            return
+        self._leases.pop(key, None)
+        release.set()
+        if (task := self._tasks.pop(key, None)) is not None:
+            await task
+    
+    async def async_release_all(self) -> None:
+        """Release every held key."""
+        for key in list(self._releases):
+            await self.async_press_end(key)
+    
+    async def _async_hold(self, key: str, release: asyncio.Event, acceleration: float) -> None:
+        """Run one hold until it is released or times out."""
+        deadline = self._bridge.hass.loop.time() + HOLD_MAX_DURATION
+        try:
+            if key in VOLUME_KEYS and await self._async_hold_volume(
+                key, release, acceleration, deadline
+            ):
+                return
+            await self._async_hold_repeat(key, release, acceleration, deadline)
+        finally:
+            if self._releases.get(key) is release:
+                # Lease or maximum duration ran out without a press_end
+                _LOGGER.debug("Hold of %s ended without release", key)
+                del self._releases[key]
+                self._tasks.pop(key, None)
+                self._leases.pop(key, None)
+    
+    async def _async_hold_repeat(
+        self,
+        key: str,
+        release: asyncio.Event,
+        acceleration: float,
+        deadline: float,
+    ) -> None:
+        """Send the key, then repeat it with an accelerating interval.
+        
+        Repeats are sent one at a time, so a slow API round trip stretches
+        the interval instead of queueing requests.
+        """
+        loop = self._bridge.hass.loop
+        await self._bridge.send_command(key)
+        
+        wait = HOLD_INITIAL_DELAY
+        interval = HOLD_REPEAT_INTERVAL
+        while self._held(key, deadline) and not await _async_wait_release(release, wait):
+            sent_at = loop.time()
+            await self._bridge.send_command(key)
+            interval = max(HOLD_MIN_INTERVAL, interval / acceleration)
+            wait = max(0.0, interval - (loop.time() - sent_at))
+    
+    async def _async_hold_volume(
+        self,
+        key: str,
+        release: asyncio.Event,
+        acceleration: float,
+        deadline: float,
+    ) -> bool:
+        """Turn a volume hold into setVolume targets.
+        
+        Steps accumulate locally with the same acceleration as key repeats.
+        The target is sent at most every HOLD_VOLUME_UPDATE_INTERVAL while
+        held and once more on release. Returns False if the current volume
+        is unknown, so the caller falls back to repeating the key.
+        """
+        start = self._bridge.snapshot.volume
+        if start is None:
+            start = await self._bridge.get_volume()
+        if start is None:
+            return False
+        
+        loop = self._bridge.hass.loop
+        direction = VOLUME_KEYS[key]
+        steps = 1
+        sent: int | None = None
+        sent_at = loop.time()
+        
+        def target() -> int:
+            return min(100, max(0, start + direction * steps))
+        
+        wait = HOLD_INITIAL_DELAY
+        interval = HOLD_REPEAT_INTERVAL
+        while self._held(key, deadline) and not await _async_wait_release(release, wait):
+            steps += 1
+            interval = max(HOLD_MIN_INTERVAL, interval / acceleration)
+            wait = interval
+            if loop.time() - sent_at >= HOLD_VOLUME_UPDATE_INTERVAL:
+                sent, sent_at = target(), loop.time()
+                # Superseded by the next update if that comes first
+                self._bridge.hass.async_create_task(self._bridge.set_volume(sent))
+        
+        if (final := target()) not in (sent, start):
+            await self._bridge.set_volume(final)
+        return True
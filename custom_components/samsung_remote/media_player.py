@@ -0,0 +1,159 @@
+"""Media player entity for Samsung TV Remote integration."""
+from __future__ import annotations
+
+import logging
+
+from homeassistant.components.media_player import (
+    MediaPlayerDeviceClass,
+    MediaPlayerEntity,
+    MediaPlayerEntityFeature,
+    MediaPlayerState,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from .const import DOMAIN
+from .entity import SamsungTVContext, SamsungTVEntity
+from .snapshot import TVSnapshot
+
+_LOGGER = logging.getLogger(__name__)
+
+# Playback statuses of the mediaPlayback capability
+PLAYBACK_STATES = {
+    "playing": MediaPlayerState.PLAYING,
+    "paused": MediaPlayerState.PAUSED,
+    "fast forwarding": MediaPlayerState.PLAYING,
+    "rewinding": MediaPlayerState.PLAYING,
+}
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up Samsung TV Remote media player from a config entry."""
+    tv = hass.data[DOMAIN][entry.entry_id]["context"]
+    
+    async_add_entities([SamsungTVMediaPlayer(tv)])
+
+
+class SamsungTVMediaPlayer(SamsungTVEntity, MediaPlayerEntity):
+    """Samsung TV media player entity.
+    
+    Shows power, volume, mute, source, title and app from one snapshot,
+    so a single entity serves dashboards and voice assistants.
+    """
+    
+    _attr_name = None
+    _attr_device_class = MediaPlayerDeviceClass.TV
+    _attr_supported_features = (
+        MediaPlayerEntityFeature.TURN_ON
+        | MediaPlayerEntityFeature.TURN_OFF
+        | MediaPlayerEntityFeature.VOLUME_SET
+        | MediaPlayerEntityFeature.VOLUME_STEP
+        | MediaPlayerEntityFeature.VOLUME_MUTE
+        | MediaPlayerEntityFeature.SELECT_SOURCE
+        | MediaPlayerEntityFeature.PLAY
+        | MediaPlayerEntityFeature.PAUSE
+        | MediaPlayerEntityFeature.STOP
+        | MediaPlayerEntityFeature.NEXT_TRACK
+        | MediaPlayerEntityFeature.PREVIOUS_TRACK
+    )
+    _attr_state = MediaPlayerState.OFF
+    
+    def __init__(self, tv: SamsungTVContext) -> None:
+        """Initialize the media player entity."""
+        self._sources: tuple[str, ...] = ()
+        super().__init__(tv, "media_player")
+    
+    @callback
+    def _update_from_snapshot(self, snapshot: TVSnapshot) -> None:
+        """Update all attributes from a snapshot."""
+        if not snapshot.power:
+            self._attr_state = MediaPlayerState.OFF
+        else:
+            self._attr_state = PLAYBACK_STATES.get(
+                snapshot.playback_status, MediaPlayerState.ON
+            )
+        
+        self._attr_is_volume_muted = snapshot.muted
+        self._attr_volume_level = (
+            snapshot.volume / 100 if snapshot.volume is not None else None
+        )
+        if snapshot.sources and snapshot.sources != self._sources:
+            self._sources = snapshot.sources
+            self._attr_source_list = list(snapshot.sources)
+        self._attr_source = self._bridge.sources.name_of(snapshot.input_source)
+        self._attr_media_title = snapshot.media_title
+        self._attr_app_name = snapshot.app
+        self._attr_media_channel = snapshot.channel_name or (
+            str(snapshot.channel) if snapshot.channel is not None else None
+        )
+    
+    async def _async_command(self, command: str) -> bool:
+        """Send a key and report whether it was sent."""
+        return await self._bridge.send_command(command)
+    
+    async def async_turn_on(self) -> None:
+        """Turn on the TV."""
+        if await self._async_command("POWER_ON"):
+            self._attr_state = MediaPlayerState.ON
+            self.async_write_ha_state()
+    
+    async def async_turn_off(self) -> None:
+        """Turn off the TV."""
+        if await self._async_command("POWER_OFF"):
+            self._attr_state = MediaPlayerState.OFF
+            self.async_write_ha_state()
+    
+    async def async_set_volume_level(self, volume: float) -> None:
+        """Set the volume level, range 0..1."""
+        if await self._bridge.set_volume(round(volume * 100)):
+            self._attr_volume_level = volume
+            self.async_write_ha_state()
+    
+    async def async_volume_up(self) -> None:
+        """Turn the volume up by one step."""
+        await self._async_command("VOLUME_UP")
+    
+    async def async_volume_down(self) -> None:
+        """Turn the volume down by one step."""
+        await self._async_command("VOLUME_DOWN")
+    
+    async def async_mute_volume(self, mute: bool) -> None:
+        """Mute or unmute the TV."""
+        if await self._async_command("MUTE" if mute else "UNMUTE"):
+            self._attr_is_volume_muted = mute
+            self.async_write_ha_state()
+    
+    async def async_select_source(self, source: str) -> None:
+        """Select an input source."""
+        if await self._bridge.async_select_source(source):
+            self._attr_source = source
+            self.async_write_ha_state()
+    
+    async def async_media_play(self) -> None:
+        """Start playback."""
+        if await self._async_command("PLAY"):
+            self._attr_state = MediaPlayerState.PLAYING
+            self.async_write_ha_state()
+    
+    async def async_media_pause(self) -> None:
+        """Pause playback."""
+        if await self._async_command("PAUSE"):
+            self._attr_state = MediaPlayerState.PAUSED
+            self.async_write_ha_state()
+    
+    async def async_media_stop(self) -> None:
+        """Stop playback."""
+        await self._async_command("STOP")
+    
+    async def async_media_next_track(self) -> None:
+        """Switch to the next channel."""
+        await self._async_command("CHANNEL_UP")
+    
+    async def async_media_previous_track(self) -> None:
+        """Switch to the previous channel."""
+        await self._async_command("CHANNEL_DOWN")
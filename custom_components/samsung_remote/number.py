@@ -1,15 +1,18 @@
 """Number entities for Samsung TV Remote integration."""
 from __future__ import annotations
 
+from abc import abstractmethod
+import asyncio
 import logging
 
 from homeassistant.components.number import NumberEntity, NumberMode
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import DOMAIN, CONF_DEVICE_ID, CONF_DEVICE_NAME
+from .const import DOMAIN, NUMBER_DEBOUNCE_COOLDOWN
+from .entity import SamsungTVContext, SamsungTVEntity
+from .snapshot import TVSnapshot
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -20,108 +23,157 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Samsung TV Remote number entities from a config entry."""
-    data = hass.data[DOMAIN][entry.entry_id]
-    bridge = data["bridge"]
-    device_id = data["device_id"]
-    device_name = entry.data.get(CONF_DEVICE_NAME, "Samsung TV")
-    
-    entities = [
-        SamsungTVVolumeNumber(bridge, device_id, device_name),
-        SamsungTVChannelNumber(bridge, device_id, device_name),
+    tv = hass.data[DOMAIN][entry.entry_id]["context"]
+    
+    entities: list[NumberEntity] = [
+        SamsungTVVolumeNumber(tv),
+        SamsungTVChannelNumber(tv),
     ]
     
+    # Further components, e.g. a soundbar, get a volume of their own
+    entities.extend(
+        SamsungTVComponentVolumeNumber(tv, component)
+        for component in tv.bridge.capabilities.secondary_components("audioVolume")
+    )
+    
     async_add_entities(entities)
 
 
-class SamsungTVVolumeNumber(NumberEntity):
+class SamsungTVDebouncedNumber(SamsungTVEntity, NumberEntity):
+    """Number entity whose changes are debounced.
+    
+    The first change is sent at once. Changes arriving while it is in
+    flight or during the cooldown after it only replace the target, and
+    the latest target is sent when the cooldown ends. A slider drag thus
+    costs one call for its start and one per cooldown until its final
+    value. The entity shows the target meanwhile.
+    """
+    
+    def __init__(self, tv: SamsungTVContext, unique_id_suffix: str) -> None:
+        """Initialize the debounced number entity."""
+        super().__init__(tv, unique_id_suffix)
+        self._target: int | None = None
+        self._sender: asyncio.Task | None = None
+    
+    @abstractmethod
+    async def _async_set(self, value: int) -> bool:
+        """Send a value to the TV."""
+    
+    async def async_set_native_value(self, value: float) -> None:
+        """Set the target; it is sent in the background."""
+        self._target = int(value)
+        self._attr_native_value = value
+        self.async_write_ha_state()
+        if self._sender is None:
+            self._sender = self.hass.async_create_background_task(
+                self._async_send_targets(), f"{DOMAIN} set {self.entity_id}"
+            )
+    
+    async def _async_send_targets(self) -> None:
+        """Send the latest target, then at most one per cooldown."""
+        try:
+            while (target := self._target) is not None:
+                success = await self._async_set(target)
+                if self._target == target:
+                    self._target = None
+                    if not success and self.coordinator.data is not None:
+                        # Show the TV's value again instead of the rejected target
+                        self._update_from_snapshot(self.coordinator.data)
+                        self.async_write_ha_state()
+                await asyncio.sleep(NUMBER_DEBOUNCE_COOLDOWN)
+        finally:
+            self._sender = None
+    
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Keep showing a pending target until it was sent."""
+        if self._target is None:
+            super()._handle_coordinator_update()
+    
+    async def async_will_remove_from_hass(self) -> None:
+        """Drop a pending target."""
+        if self._sender is not None:
+            self._sender.cancel()
+        await super().async_will_remove_from_hass()
+
+
+class SamsungTVVolumeNumber(SamsungTVDebouncedNumber):
     """Samsung TV volume number entity."""
     
-    _attr_has_entity_name = True
     _attr_name = "Volume"
+    _requires_power = True
     _attr_icon = "mdi:volume-high"
     _attr_native_min_value = 0
     _attr_native_max_value = 100
     _attr_native_step = 1
     _attr_mode = NumberMode.SLIDER
+    _attr_native_value = 0
     
-    def __init__(
-        self,
-        bridge,
-        device_id: str,
-        device_name: str,
-    ) -> None:
+    def __init__(self, tv: SamsungTVContext) -> None:
         """Initialize the volume number entity."""
-        self._bridge = bridge
-        self._device_id = device_id
-        self._device_name = device_name
-        self._attr_unique_id = f"{device_id}_volume_number"
-        self._attr_native_value = 0
-    
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._device_id)},
-            name=self._device_name,
-            manufacturer="Samsung",
-            model="Smart TV",
-        )
+        super().__init__(tv, "volume_number")
     
-    async def async_set_native_value(self, value: float) -> None:
+    @callback
+    def _update_from_snapshot(self, snapshot: TVSnapshot) -> None:
+        """Update the volume from a snapshot."""
+        if snapshot.volume is not None:
+            self._attr_native_value = snapshot.volume
+    
+    async def _async_set(self, value: int) -> bool:
         """Set the volume level."""
-        if await self._bridge.set_volume(int(value)):
-            self._attr_native_value = value
-            self.async_write_ha_state()
-    
-    async def async_update(self) -> None:
-        """Update the entity state."""
-        volume = await self._bridge.get_volume()
-        if volume is not None:
-            self._attr_native_value = volume
+        return await self._bridge.set_volume(value)
 
 
-class SamsungTVChannelNumber(NumberEntity):
+class SamsungTVChannelNumber(SamsungTVDebouncedNumber):
     """Samsung TV channel number entity."""
     
-    _attr_has_entity_name = True
     _attr_name = "Channel"
+    _requires_power = True
     _attr_icon = "mdi:television-classic"
     _attr_native_min_value = 1
     _attr_native_max_value = 9999
     _attr_native_step = 1
     _attr_mode = NumberMode.BOX
+    _attr_native_value = 1
     
-    def __init__(
-        self,
-        bridge,
-        device_id: str,
-        device_name: str,
-    ) -> None:
+    def __init__(self, tv: SamsungTVContext) -> None:
         """Initialize the channel number entity."""
-        self._bridge = bridge
-        self._device_id = device_id
-        self._device_name = device_name
-        self._attr_unique_id = f"{device_id}_channel_number"
-        self._attr_native_value = 1
-    
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._device_id)},
-            name=self._device_name,
-            manufacturer="Samsung",
-            model="Smart TV",
-        )
+        super().__init__(tv, "channel_number")
     
-    async def async_set_native_value(self, value: float) -> None:
+    @callback
+    def _update_from_snapshot(self, snapshot: TVSnapshot) -> None:
+        """Update the channel from a snapshot."""
+        if snapshot.channel is not None:
+            self._attr_native_value = snapshot.channel
+    
+    async def _async_set(self, value: int) -> bool:
         """Set the channel."""
-        if await self._bridge.set_channel(int(value)):
-            self._attr_native_value = value
-            self.async_write_ha_state()
-    
-    async def async_update(self) -> None:
-        """Update the entity state."""
-        channel = await self._bridge.get_channel()
-        if channel is not None:
-            self._attr_native_value = channel
+        return await self._bridge.set_channel(value)
+
+
+class SamsungTVComponentVolumeNumber(SamsungTVDebouncedNumber):
+    """Volume of a further component of the device."""
+    
+    _attr_icon = "mdi:volume-high"
+    _attr_native_min_value = 0
+    _attr_native_max_value = 100
+    _attr_native_step = 1
+    _attr_mode = NumberMode.SLIDER
+    _attr_native_value = 0
+    
+    def __init__(self, tv: SamsungTVContext, component: str) -> None:
+        """Initialize the component volume number entity."""
+        self._component = component
+        super().__init__(tv, f"{component}_volume_number")
+        self._attr_name = f"{component} Volume"
+    
+    @callback
+    def _update_from_snapshot(self, snapshot: TVSnapshot) -> None:
+        """Update the volume from the component snapshot."""
+        component = snapshot.component(self._component)
+        if component is not None and component.volume is not None:
+            self._attr_native_value = component.volume
+    
+    async def _async_set(self, value: int) -> bool:
+        """Set the volume level of the component."""
+        return await self._bridge.async_send_to_component(self._component, "SET_VOLUME", value)
@@ -0,0 +1,86 @@
+"""Opt-in stage profiling for Samsung TV Remote integration.
+
+Call sites take a start time only while profiling is enabled and pass it
+to ``lap``, so a disabled profiler costs one attribute check per stage.
+"""
+from __future__ import annotations
+
+import logging
+import time
+from typing import Any
+
+_LOGGER = logging.getLogger(__name__)
+
+# Stages of a request and the resulting entity update
+STAGE_TOKEN = "token"
+STAGE_BUILD = "build"
+STAGE_NETWORK = "network"
+STAGE_DECODE = "decode"
+STAGE_PARSE = "parse"
+STAGE_ENTITY_WRITE = "entity_write"
+
+
+class StageProfiler:
+    """Aggregate per-stage timings of one bridge."""
+    
+    __slots__ = ("enabled", "_stats", "_started")
+    
+    def __init__(self) -> None:
+        """Initialize a disabled profiler."""
+        self.enabled = False
+        self._stats: dict[str, list[float]] = {}
+        self._started = 0.0
+    
+    def start(self) -> None:
+        """Enable profiling with fresh statistics."""
+        self._stats = {}
+        self._started = time.monotonic()
+        self.enabled = True
+    
+    def stop(self) -> None:
+        """Disable profiling, keeping the collected statistics."""
+        self.enabled = False
+    
+    def lap(self, stage: str, started: float) -> float:
+        """Record the time since started for a stage and return the current time."""
+        now = time.perf_counter()
+        elapsed = now - started
+        if (stats := self._stats.get(stage)) is None:
+            self._stats[stage] = [1, elapsed, elapsed]
+        else:
+            stats[0] += 1
+            stats[1] += elapsed
+            if elapsed > stats[2]:
+                stats[2] = elapsed
+        return now
+    
+    def as_dict(self) -> dict[str, Any]:
+        """Return the aggregated timings in milliseconds."""
+        return {
+            "enabled": self.enabled,
+            "duration": round(time.monotonic() - self._started, 1) if self._stats else 0,
+            "stages": {
+                stage: {
+                    "count": int(count),
+                    "mean_ms": round(total / count * 1000, 3),
+                    "max_ms": round(maximum * 1000, 3),
+                    "total_ms": round(total * 1000, 1),
+                }
+                for stage, (count, total, maximum) in self._stats.items()
+            },
+        }
+    
+    def log_summary(self, name: str) -> None:
+        """Log the aggregated timings."""
+        stages = self.as_dict()["stages"]
+        if not stages:
+            _LOGGER.info("Profile %s: no samples", name)
+            return
+        _LOGGER.info(
+            "Profile %s: %s",
+            name,
+            ", ".join(
+                f"{stage} n={stats['count']} mean={stats['mean_ms']}ms max={stats['max_ms']}ms"
+                for stage, stats in stages.items()
+            ),
+        )
@@ -5,14 +5,31 @@ import logging
 
 from homeassistant.components.select import SelectEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import DOMAIN, CONF_DEVICE_ID, CONF_DEVICE_NAME, HDMI_SOURCES
+from .commands import ALL_BUTTON_COMMANDS
+from .const import (
+    DOMAIN,
+    BUTTON_MODE_COMPACT,
+    CONF_BUTTON_MODE,
+    DEFAULT_BUTTON_MODE,
+    HDMI_SOURCES,
+    KNOWN_APPS,
+)
+from .entity import (
+    SamsungTVContext,
+    SamsungTVEntity,
+    SamsungTVStatelessEntity,
+    async_remove_stale_entities,
+)
+from .snapshot import TVSnapshot
 
 _LOGGER = logging.getLogger(__name__)
 
+# Known app names by app ID, for TVs that report the running app by ID
+APP_NAMES = {app_id: name for name, app_id in KNOWN_APPS.items()}
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -20,57 +37,138 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Samsung TV Remote select entities from a config entry."""
-    data = hass.data[DOMAIN][entry.entry_id]
-    bridge = data["bridge"]
-    device_id = data["device_id"]
-    device_name = entry.data.get(CONF_DEVICE_NAME, "Samsung TV")
+    tv = hass.data[DOMAIN][entry.entry_id]["context"]
     
-    entities = [
-        SamsungTVSourceSelect(bridge, device_id, device_name),
+    entities: list[SelectEntity] = [
+        SamsungTVSourceSelect(tv),
+        SamsungTVAppSelect(tv),
+        SamsungTVFavoriteChannelSelect(tv),
     ]
     
+    # Compact button mode replaces the key buttons with one keypad entity
+    if entry.options.get(CONF_BUTTON_MODE, DEFAULT_BUTTON_MODE) == BUTTON_MODE_COMPACT:
+        entities.append(SamsungTVKeypadSelect(tv))
+    
+    async_remove_stale_entities(hass, entry, "select", entities)
     async_add_entities(entities)
 
 
-class SamsungTVSourceSelect(SelectEntity):
-    """Samsung TV source select entity."""
+class SamsungTVSourceSelect(SamsungTVEntity, SelectEntity):
+    """Samsung TV source select entity.
+    
+    Offers the sources the TV reports, falling back to the HDMI keys when
+    it reports none.
+    """
     
-    _attr_has_entity_name = True
     _attr_name = "Input Source"
+    _requires_power = True
     _attr_icon = "mdi:video-input-hdmi"
     _attr_options = HDMI_SOURCES
+    _attr_current_option = None
     
-    def __init__(
-        self,
-        bridge,
-        device_id: str,
-        device_name: str,
-    ) -> None:
+    def __init__(self, tv: SamsungTVContext) -> None:
         """Initialize the source select entity."""
-        self._bridge = bridge
-        self._device_id = device_id
-        self._device_name = device_name
-        self._attr_unique_id = f"{device_id}_source_select"
-        self._attr_current_option = None
-    
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._device_id)},
-            name=self._device_name,
-            manufacturer="Samsung",
-            model="Smart TV",
-        )
+        self._sources: tuple[str, ...] = ()
+        super().__init__(tv, "source_select")
+    
+    @callback
+    def _update_from_snapshot(self, snapshot: TVSnapshot) -> None:
+        """Update the sources and the current source from a snapshot."""
+        if snapshot.sources and snapshot.sources != self._sources:
+            self._sources = snapshot.sources
+            self._attr_options = list(snapshot.sources)
+        
+        name = self._bridge.sources.name_of(snapshot.input_source)
+        if name in self._attr_options:
+            self._attr_current_option = name
     
     async def async_select_option(self, option: str) -> None:
         """Select an input source."""
-        if await self._bridge.send_command(option):
+        if await self._bridge.async_select_source(option):
+            self._attr_current_option = option
+            self.async_write_ha_state()
+
+
+class SamsungTVAppSelect(SamsungTVEntity, SelectEntity):
+    """Samsung TV app select entity that launches apps directly."""
+    
+    _attr_name = "App"
+    _requires_power = True
+    _attr_icon = "mdi:apps"
+    _attr_options = list(KNOWN_APPS)
+    _attr_current_option = None
+    
+    def __init__(self, tv: SamsungTVContext) -> None:
+        """Initialize the app select entity."""
+        super().__init__(tv, "app_select")
+    
+    @callback
+    def _update_from_snapshot(self, snapshot: TVSnapshot) -> None:
+        """Update the current app from a snapshot."""
+        if snapshot.app in KNOWN_APPS:
+            self._attr_current_option = snapshot.app
+        else:
+            self._attr_current_option = APP_NAMES.get(snapshot.app)
+    
+    async def async_select_option(self, option: str) -> None:
+        """Launch an app."""
+        if await self._bridge.async_launch_app(option):
+            self._attr_current_option = option
+            self.async_write_ha_state()
+
+
+class SamsungTVFavoriteChannelSelect(SamsungTVEntity, SelectEntity):
+    """Samsung TV favourite channel shortcuts from the channel index."""
+    
+    _attr_name = "Favorite Channel"
+    _requires_power = True
+    _attr_icon = "mdi:star"
+    _attr_options: list[str] = []
+    _attr_current_option = None
+    
+    def __init__(self, tv: SamsungTVContext) -> None:
+        """Initialize the favourite channel select entity."""
+        self._favorites: dict[str, int] = {}
+        super().__init__(tv, "favorite_channel_select")
+    
+    @callback
+    def _update_from_snapshot(self, snapshot: TVSnapshot) -> None:
+        """Update the favourites and the current channel."""
+        self._favorites = {
+            channel.label: channel.number for channel in self._bridge.channels.favorites
+        }
+        self._attr_options = list(self._favorites)
+        
+        channel = self._bridge.channels.get(snapshot.channel) if snapshot.channel else None
+        self._attr_current_option = (
+            channel.label if channel is not None and channel.favorite else None
+        )
+    
+    async def async_select_option(self, option: str) -> None:
+        """Tune to a favourite channel."""
+        if (number := self._favorites.get(option)) is None:
+            return
+        if await self._bridge.set_channel(number):
             self._attr_current_option = option
             self.async_write_ha_state()
+
+
+class SamsungTVKeypadSelect(SamsungTVStatelessEntity, SelectEntity):
+    """Keypad entity that sends any remote key.
+    
+    Selecting an option sends the key. The entity keeps no current option,
+    so key presses do not produce state changes or recorder rows.
+    """
     
-    async def async_update(self) -> None:
-        """Update the entity state."""
-        source = await self._bridge.get_input_source()
-        if source and source in HDMI_SOURCES:
-            self._attr_current_option = source
+    _attr_name = "Keypad"
+    _attr_icon = "mdi:remote"
+    _attr_options = list(ALL_BUTTON_COMMANDS)
+    _attr_current_option = None
+    
+    def __init__(self, tv: SamsungTVContext) -> None:
+        """Initialize the keypad select entity."""
+        super().__init__(tv, "keypad_select")
+    
+    async def async_select_option(self, option: str) -> None:
+        """Send the selected key."""
+        await self._bridge.send_command(option)
@@ -3,13 +3,18 @@ from __future__ import annotations
 
 import logging
 
-from homeassistant.components.sensor import SensorEntity
+from typing import Any
+
+from homeassistant.components.sensor import SensorDeviceClass, SensorEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.const import EntityCategory
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import DOMAIN, CONF_DEVICE_ID, CONF_DEVICE_NAME
+from .const import DOMAIN
+from .entity import SamsungTVContext, SamsungTVEntity
+from .health import HEALTH_STATES
+from .snapshot import TVSnapshot
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -20,124 +25,116 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Samsung TV Remote sensor entities from a config entry."""
-    data = hass.data[DOMAIN][entry.entry_id]
-    bridge = data["bridge"]
-    device_id = data["device_id"]
-    device_name = entry.data.get(CONF_DEVICE_NAME, "Samsung TV")
+    tv = hass.data[DOMAIN][entry.entry_id]["context"]
     
     entities = [
-        SamsungTVActivitySensor(bridge, device_id, device_name),
-        SamsungTVMediaTitleSensor(bridge, device_id, device_name),
-        SamsungTVAppSensor(bridge, device_id, device_name),
+        SamsungTVActivitySensor(tv),
+        SamsungTVMediaTitleSensor(tv),
+        SamsungTVAppSensor(tv),
+        SamsungTVConnectionSensor(tv),
     ]
     
     async_add_entities(entities)
 
 
-class SamsungTVActivitySensor(SensorEntity):
+class SamsungTVActivitySensor(SamsungTVEntity, SensorEntity):
     """Samsung TV current activity sensor entity."""
     
-    _attr_has_entity_name = True
     _attr_name = "Activity"
+    _requires_power = True
     _attr_icon = "mdi:television-play"
+    _attr_native_value = "unknown"
     
-    def __init__(
-        self,
-        bridge,
-        device_id: str,
-        device_name: str,
-    ) -> None:
+    def __init__(self, tv: SamsungTVContext) -> None:
         """Initialize the activity sensor entity."""
-        self._bridge = bridge
-        self._device_id = device_id
-        self._device_name = device_name
-        self._attr_unique_id = f"{device_id}_activity_sensor"
-        self._attr_native_value = "unknown"
+        super().__init__(tv, "activity_sensor")
     
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._device_id)},
-            name=self._device_name,
-            manufacturer="Samsung",
-            model="Smart TV",
-        )
-    
-    async def async_update(self) -> None:
-        """Update the entity state."""
-        activity = await self._bridge.get_current_activity()
-        if activity:
-            self._attr_native_value = activity
+    @callback
+    def _update_from_snapshot(self, snapshot: TVSnapshot) -> None:
+        """Update the activity from a snapshot."""
+        if snapshot.playback_status:
+            self._attr_native_value = snapshot.playback_status
 
 
-class SamsungTVMediaTitleSensor(SensorEntity):
+class SamsungTVMediaTitleSensor(SamsungTVEntity, SensorEntity):
     """Samsung TV media title sensor entity."""
     
-    _attr_has_entity_name = True
     _attr_name = "Media Title"
+    _requires_power = True
+    # Duplicates the media player and changes often; opt-in to keep history small
+    _attr_entity_registry_enabled_default = False
     _attr_icon = "mdi:movie"
+    _attr_native_value = None
     
-    def __init__(
-        self,
-        bridge,
-        device_id: str,
-        device_name: str,
-    ) -> None:
+    def __init__(self, tv: SamsungTVContext) -> None:
         """Initialize the media title sensor entity."""
-        self._bridge = bridge
-        self._device_id = device_id
-        self._device_name = device_name
-        self._attr_unique_id = f"{device_id}_media_title_sensor"
-        self._attr_native_value = None
-    
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._device_id)},
-            name=self._device_name,
-            manufacturer="Samsung",
-            model="Smart TV",
-        )
+        super().__init__(tv, "media_title_sensor")
     
-    async def async_update(self) -> None:
-        """Update the entity state."""
-        title = await self._bridge.get_media_title()
-        self._attr_native_value = title
+    @callback
+    def _update_from_snapshot(self, snapshot: TVSnapshot) -> None:
+        """Update the media title from a snapshot."""
+        self._attr_native_value = snapshot.media_title
 
 
-class SamsungTVAppSensor(SensorEntity):
+class SamsungTVAppSensor(SamsungTVEntity, SensorEntity):
     """Samsung TV current app sensor entity."""
     
-    _attr_has_entity_name = True
     _attr_name = "Current App"
+    _requires_power = True
+    # Duplicates the media player and changes often; opt-in to keep history small
+    _attr_entity_registry_enabled_default = False
     _attr_icon = "mdi:application"
+    _attr_native_value = None
     
-    def __init__(
-        self,
-        bridge,
-        device_id: str,
-        device_name: str,
-    ) -> None:
+    def __init__(self, tv: SamsungTVContext) -> None:
         """Initialize the app sensor entity."""
-        self._bridge = bridge
-        self._device_id = device_id
-        self._device_name = device_name
-        self._attr_unique_id = f"{device_id}_app_sensor"
-        self._attr_native_value = None
+        super().__init__(tv, "app_sensor")
     
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._device_id)},
-            name=self._device_name,
-            manufacturer="Samsung",
-            model="Smart TV",
+    @callback
+    def _update_from_snapshot(self, snapshot: TVSnapshot) -> None:
+        """Update the current app from a snapshot."""
+        self._attr_native_value = snapshot.app
+
+
+class SamsungTVConnectionSensor(SamsungTVEntity, SensorEntity):
+    """Health of the connection to the SmartThings API.
+    
+    Follows the connection monitor rather than the coordinator, and stays
+    available when the API fails, since that is what it reports.
+    """
+    
+    _attr_name = "Connection"
+    _attr_icon = "mdi:lan-connect"
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_device_class = SensorDeviceClass.ENUM
+    _attr_options = HEALTH_STATES
+    
+    def __init__(self, tv: SamsungTVContext) -> None:
+        """Initialize the connection sensor entity."""
+        super().__init__(tv, "connection_sensor")
+    
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to health changes."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self._bridge.health.async_add_listener(self.async_write_ha_state)
         )
     
-    async def async_update(self) -> None:
-        """Update the entity state."""
-        app = await self._bridge.get_current_app()
-        self._attr_native_value = app
+    @property
+    def available(self) -> bool:
+        """Return True; an unreachable API is reported as the state."""
+        return True
+    
+    @property
+    def native_value(self) -> str | None:
+        """Return the connection health."""
+        return self._bridge.health.state
+    
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return whether the connection is being kept warm."""
+        return {"keep_warm": self._bridge.health.keeping_warm}
+    
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Ignore snapshots; health changes are written by the monitor."""
@@ -5,18 +5,100 @@ config entry, exactly like the native SmartThings integration does.
 """
 from __future__ import annotations
 
+import asyncio
+from collections.abc import AsyncIterator, Awaitable, Callable
+from dataclasses import replace
 import logging
-from typing import Any
+import time
+from typing import Any, NamedTuple
 
 import aiohttp
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.storage import Store
+from homeassistant.util.json import json_loads
 
-from .const import SMARTTHINGS_API_BASE, SMARTTHINGS_COMMANDS
+from .capabilities import MAIN_COMPONENT, CapabilityIndex
+from .catalog import SourceCatalog
+from .channels import ChannelIndex
+from .commands import (
+    COMMANDS,
+    POWER_TOGGLE,
+    CommandDescriptor,
+    commands_for_model,
+    lookup,
+    render_batch,
+)
+from .const import (
+    CONFIRM_DELAY,
+    DOMAIN,
+    KNOWN_APPS,
+    POWER_GRACE,
+    SMARTTHINGS_API_BASE,
+    STATUS_MAX_AGE,
+    TIMEOUT_COMMAND,
+    TIMEOUT_DISCOVERY,
+    TIMEOUT_STATUS,
+)
+from .health import ConnectionMonitor
+from .profiler import (
+    STAGE_BUILD,
+    STAGE_DECODE,
+    STAGE_NETWORK,
+    STAGE_PARSE,
+    STAGE_TOKEN,
+    StageProfiler,
+)
+from .snapshot import SNAPSHOT_CAPABILITIES, StatusParser, TVSnapshot
+from .tracing import BridgeTracer
 
 _LOGGER = logging.getLogger(__name__)
 
+# Interactive keys get a short budget, status polls a medium one and
+# discovery (large account listings) the longest.
+COMMAND_TIMEOUT = aiohttp.ClientTimeout(total=TIMEOUT_COMMAND)
+STATUS_TIMEOUT = aiohttp.ClientTimeout(total=TIMEOUT_STATUS)
+DISCOVERY_TIMEOUT = aiohttp.ClientTimeout(total=TIMEOUT_DISCOVERY)
+
+# Idempotent reads are retried once on these transient statuses
+RETRY_STATUSES = frozenset({429, 502, 503, 504})
+RETRY_DELAY = 0.5
+
+# setTvChannel is answered with these when the TV does not support it;
+# only then is tuning retried with digit keys
+CHANNEL_REJECTED_STATUSES = frozenset({400, 422})
+
+# Device descriptions are stored to set up without waiting for the API
+DEVICE_STORAGE_VERSION = 1
+
+# Where a status read was answered from. A stale read is the last known
+# status returned because fetching a fresh one failed.
+STATUS_SOURCE_CACHE = "cache"
+STATUS_SOURCE_NETWORK = "network"
+STATUS_SOURCE_SHARED = "shared"
+STATUS_SOURCE_STALE = "stale"
+
+
+class ApiResponse(NamedTuple):
+    """Raw result of a request sent through the bridge pipeline."""
+    
+    status: int
+    body: bytes
+    
+    @property
+    def ok(self) -> bool:
+        """Return True for a successful response."""
+        return self.status == 200
+
+
+class StatusRead(NamedTuple):
+    """A device status document and the source it was served from."""
+    
+    status: dict[str, Any]
+    source: str
+
 
 class SmartThingsBridge:
     """Bridge class to interact with SmartThings using existing integration auth."""
@@ -34,6 +116,37 @@ class SmartThingsBridge:
         self._device_info: dict[str, Any] = {}
         self._available = False
         self._cached_status: dict[str, Any] = {}
+        self._latest_tasks: dict[str, asyncio.Task] = {}
+        self._status_task: asyncio.Task[StatusRead] | None = None
+        self._status_time: float = 0.0
+        self._capability_tasks: dict[tuple[str, str], asyncio.Task[TVSnapshot | None]] = {}
+        self._confirm_handles: dict[tuple[str, str], asyncio.TimerHandle] = {}
+        # Power state requested by a command, kept until the grace ends
+        self._requested_power: tuple[bool, float] | None = None
+        self._snapshot = TVSnapshot()
+        self._capabilities = CapabilityIndex()
+        # Commands routed to the component providing their capability
+        self._commands: dict[str, CommandDescriptor] = COMMANDS
+        self._parser = StatusParser()
+        self.channels = ChannelIndex(hass, device_id)
+        self._device_store = _device_store(hass, device_id)
+        # Tune with setTvChannel until the device turns out not to support it
+        self._channel_direct = True
+        self._listeners: list[Callable[[TVSnapshot], None]] = []
+        self._key_queue: asyncio.Queue[str] = asyncio.Queue()
+        self._key_worker: asyncio.Task | None = None
+        self.tracer = BridgeTracer()
+        self.profiler = StageProfiler()
+        self.health = ConnectionMonitor(self)
+        
+        # Per-device request templates, built once
+        self._url_device = f"{SMARTTHINGS_API_BASE}/devices/{device_id}"
+        self._url_status = f"{self._url_device}/status"
+        self._url_commands = f"{self._url_device}/commands"
+        
+        # Request headers, rebuilt only when the token changes
+        self._headers: dict[str, str] = {}
+        self._headers_token: str | None = None
     
     @property
     def available(self) -> bool:
@@ -45,6 +158,55 @@ class SmartThingsBridge:
         """Return device information."""
         return self._device_info
     
+    @property
+    def snapshot(self) -> TVSnapshot:
+        """Return the last parsed device state."""
+        return self._snapshot
+    
+    @property
+    def capabilities(self) -> CapabilityIndex:
+        """Return the capability index of the device."""
+        return self._capabilities
+    
+    @property
+    def sources(self) -> SourceCatalog:
+        """Return the input source catalog."""
+        return self._parser.sources
+    
+    @property
+    def key_queue_depth(self) -> int:
+        """Return the number of keys waiting to be sent."""
+        return self._key_queue.qsize()
+    
+    @callback
+    def async_add_listener(self, listener: Callable[[TVSnapshot], None]) -> CALLBACK_TYPE:
+        """Listen for snapshot changes. Returns a function to remove the listener."""
+        self._listeners.append(listener)
+        
+        @callback
+        def remove_listener() -> None:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+        
+        return remove_listener
+    
+    @callback
+    def _async_set_snapshot(self, snapshot: TVSnapshot) -> None:
+        """Store a new snapshot and notify listeners if it changed."""
+        if self._requested_power is not None:
+            power, until = self._requested_power
+            if time.monotonic() >= until:
+                self._requested_power = None
+            elif snapshot.power != power:
+                # The cloud still reports the state from before the command
+                snapshot = replace(snapshot, power=power)
+        if snapshot == self._snapshot:
+            return
+        self.tracer.record_snapshot(self._snapshot, snapshot)
+        self._snapshot = snapshot
+        for listener in list(self._listeners):
+            listener(snapshot)
+    
     def _get_access_token(self) -> str | None:
         """Get access token from SmartThings integration.
         
@@ -115,261 +277,586 @@ class SmartThingsBridge:
         _LOGGER.warning("Could not retrieve access token from SmartThings integration")
         return None
     
-    async def async_initialize(self) -> None:
-        """Initialize the bridge and fetch device info."""
+    def _get_headers(self) -> dict[str, str] | None:
+        """Return the request headers for the current token."""
         token = self._get_access_token()
         if not token:
+            return None
+        
+        if token != self._headers_token:
+            self._headers = {
+                "Authorization": f"Bearer {token}",
+                "Content-Type": "application/json",
+            }
+            self._headers_token = token
+        return self._headers
+    
+    async def _async_request(
+        self,
+        method: str,
+        url: str,
+        timeout: aiohttp.ClientTimeout,
+        body: bytes | None = None,
+    ) -> ApiResponse | None:
+        """Send a request through the shared pipeline.
+        
+        All API traffic of the bridge goes through here, so retries and
+        other cross-cutting behaviour live in one place. Returns None when
+        no token is available or the request failed at transport level.
+        """
+        profiler = self.profiler
+        started = time.perf_counter() if profiler.enabled else 0.0
+        
+        headers = self._get_headers()
+        if headers is None:
+            _LOGGER.error("No valid SmartThings token available")
+            return None
+        if started:
+            started = profiler.lap(STAGE_TOKEN, started)
+        
+        session = async_get_clientsession(self.hass)
+        max_retries = 1 if method == "GET" else 0
+        retries = 0
+        # Traces keep the path below the device URL only
+        endpoint = url.removeprefix(self._url_device) or "/"
+        start = time.monotonic()
+        if started:
+            started = profiler.lap(STAGE_BUILD, started)
+        
+        while True:
+            try:
+                async with session.request(
+                    method, url, headers=headers, data=body, timeout=timeout
+                ) as response:
+                    result = ApiResponse(response.status, await response.read())
+            except asyncio.TimeoutError:
+                _LOGGER.warning("Timed out on %s %s", method, url)
+                self.tracer.record_request(
+                    method, endpoint, None, time.monotonic() - start, retries, "timeout"
+                )
+                self.health.async_record_request(None, time.monotonic() - start)
+                return None
+            except aiohttp.ClientError as err:
+                _LOGGER.error("Error on %s %s: %s", method, url, err)
+                self.tracer.record_request(
+                    method, endpoint, None, time.monotonic() - start, retries, repr(err)
+                )
+                self.health.async_record_request(None, time.monotonic() - start)
+                return None
+            
+            if result.status in RETRY_STATUSES and retries < max_retries:
+                retries += 1
+                await asyncio.sleep(RETRY_DELAY)
+                continue
+            if started:
+                profiler.lap(STAGE_NETWORK, started)
+            self.tracer.record_request(
+                method, endpoint, result.status, time.monotonic() - start, retries
+            )
+            self.health.async_record_request(result.status, time.monotonic() - start)
+            return result
+    
+    async def async_initialize(self) -> bool:
+        """Initialize the bridge from the stored or fetched device info.
+        
+        The stored description is used when there is one, so setup does
+        not wait for the API. Returns True in that case; the description
+        should then be refreshed with ``async_refresh_device_info``.
+        """
+        if not self._get_headers():
             raise ValueError("No valid SmartThings token available")
         
-        # Fetch device information
-        self._device_info = await self._fetch_device_info(token)
+        await self.channels.async_load()
+        if stored := await self._device_store.async_load():
+            self._apply_device_info(stored)
+        else:
+            self._apply_device_info(await self._fetch_device_info())
+            await self._device_store.async_save(self._device_info)
         self._available = True
         _LOGGER.info("SmartThings bridge initialized for device: %s", self.device_id)
+        return bool(stored)
     
-    async def _fetch_device_info(self, token: str) -> dict[str, Any]:
+    async def async_refresh_device_info(self) -> bool:
+        """Fetch the device info and return if its components changed."""
+        device_info = await self._fetch_device_info()
+        if device_info == self._device_info:
+            return False
+        
+        components = self._device_info.get("components")
+        self._apply_device_info(device_info)
+        await self._device_store.async_save(device_info)
+        return device_info.get("components") != components
+    
+    def _apply_device_info(self, device_info: dict[str, Any]) -> None:
+        """Build the capability index and routed commands of a device."""
+        self._device_info = device_info
+        self._capabilities = CapabilityIndex(device_info)
+        model = (device_info.get("ocf") or {}).get("modelNumber")
+        self._commands = self._capabilities.route(commands_for_model(model))
+        self._parser = StatusParser(self._capabilities)
+        self._channel_direct = self._capabilities.component_for("tvChannel") is not None
+    
+    async def _fetch_device_info(self) -> dict[str, Any]:
         """Fetch device information from SmartThings API."""
-        url = f"{SMARTTHINGS_API_BASE}/devices/{self.device_id}"
-        headers = {
-            "Authorization": f"Bearer {token}",
-            "Content-Type": "application/json",
-        }
-        
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, headers=headers) as response:
-                if response.status == 200:
-                    return await response.json()
-                elif response.status == 401:
-                    raise ValueError("SmartThings token expired or invalid")
-                else:
-                    error_text = await response.text()
-                    raise ValueError(f"Failed to fetch device info: {response.status} - {error_text}")
+        response = await self._async_request("GET", self._url_device, STATUS_TIMEOUT)
+        if response is None:
+            raise ValueError("Failed to fetch device info: no response")
+        if response.ok:
+            return json_loads(response.body)
+        if response.status == 401:
+            raise ValueError("SmartThings token expired or invalid")
+        raise ValueError(
+            f"Failed to fetch device info: {response.status} - "
+            f"{response.body.decode(errors='replace')}"
+        )
     
-    async def send_command(self, command: str) -> bool:
-        """Send a command to the Samsung TV."""
-        token = self._get_access_token()
-        if not token:
-            _LOGGER.error("No valid SmartThings token available")
+    async def _async_run_latest(self, key: str, request: Awaitable[bool]) -> bool:
+        """Run a request, cancelling any older in-flight request for the same key.
+        
+        Used for absolute setters (volume, channel) where only the newest
+        target matters. A superseded call returns False instead of raising.
+        """
+        previous = self._latest_tasks.get(key)
+        if previous is not None and not previous.done():
+            previous.cancel()
+        
+        task = self._latest_tasks[key] = asyncio.ensure_future(request)
+        try:
+            return await task
+        except asyncio.CancelledError:
+            current = asyncio.current_task()
+            if current is not None and current.cancelling():
+                # The caller itself was cancelled, not superseded
+                raise
+            _LOGGER.debug("Request %s superseded by a newer one", key)
             return False
+        finally:
+            if self._latest_tasks.get(key) is task:
+                del self._latest_tasks[key]
+    
+    async def _async_send(
+        self,
+        body: bytes,
+        action: str,
+        capability: str | None = None,
+        component: str | None = None,
+    ) -> bool:
+        """Post a command body and return if it succeeded."""
+        response = await self._async_post_command(body, action, capability, component)
+        return response is not None and response.ok
+    
+    async def _async_post_command(
+        self,
+        body: bytes,
+        action: str,
+        capability: str | None = None,
+        component: str | None = None,
+    ) -> ApiResponse | None:
+        """Post a command body within the command timeout budget.
         
-        command_upper = command.upper()
+        After a successful command the capability it changed is read back.
+        Returns None when the request failed at transport level.
+        """
+        self.health.async_activity()
+        response = await self._async_request(
+            "POST", self._url_commands, COMMAND_TIMEOUT, body
+        )
+        if response is None:
+            return None
+        if not response.ok:
+            _LOGGER.error(
+                "Failed %s: %s - %s",
+                action,
+                response.status,
+                response.body.decode(errors="replace"),
+            )
+            return response
         
-        if command_upper not in SMARTTHINGS_COMMANDS:
+        # The command changed the device, don't serve the cached status
+        self._status_time = 0.0
+        if capability is not None:
+            self._async_schedule_confirmation(capability, component)
+        return response
+    
+    @callback
+    def _async_schedule_confirmation(self, capability: str, component: str | None) -> None:
+        """Read a capability back shortly after a command changed it.
+        
+        Debounced per capability, so a burst of commands is confirmed by a
+        single read once it settles. Capabilities without a state in the
+        snapshot are not read. The power state is read once the TV had
+        POWER_GRACE to follow the command.
+        """
+        if capability not in SNAPSHOT_CAPABILITIES:
+            return
+        component = component or self._capabilities.component_for(capability)
+        if component is None:
+            return
+        
+        key = (component, capability)
+        if (handle := self._confirm_handles.pop(key, None)) is not None:
+            handle.cancel()
+        self._confirm_handles[key] = self.hass.loop.call_later(
+            POWER_GRACE if capability == "switch" else CONFIRM_DELAY,
+            self._async_confirm,
+            component,
+            capability,
+        )
+    
+    @callback
+    def _async_confirm(self, component: str, capability: str) -> None:
+        """Start a scheduled confirmation read."""
+        del self._confirm_handles[(component, capability)]
+        self.hass.async_create_background_task(
+            self.async_read_capability(capability, component),
+            f"samsung_remote confirm {capability} {self.device_id}",
+        )
+    
+    async def send_command(self, command: str) -> bool:
+        """Send a command to the Samsung TV."""
+        descriptor = lookup(self._commands, command)
+        if descriptor is None and command.upper() == POWER_TOGGLE:
+            # POWER toggles by the last known power state
+            descriptor = self._commands["POWER_OFF" if self._snapshot.power else "POWER_ON"]
+        if descriptor is None:
             _LOGGER.warning("Unknown command: %s", command)
             return False
         
-        cmd_config = SMARTTHINGS_COMMANDS[command_upper]
-        
-        url = f"{SMARTTHINGS_API_BASE}/devices/{self.device_id}/commands"
-        headers = {
-            "Authorization": f"Bearer {token}",
-            "Content-Type": "application/json",
-        }
-        
-        payload = {
-            "commands": [
-                {
-                    "component": cmd_config["component"],
-                    "capability": cmd_config["capability"],
-                    "command": cmd_config["command"],
-                    "arguments": cmd_config["args"],
-                }
-            ]
-        }
-        
-        try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(url, headers=headers, json=payload) as response:
-                    if response.status == 200:
-                        _LOGGER.debug("Command %s sent successfully", command)
-                        return True
-                    else:
-                        error_text = await response.text()
-                        _LOGGER.error(
-                            "Failed to send command %s: %s - %s",
-                            command,
-                            response.status,
-                            error_text,
-                        )
-                        return False
-        except Exception as err:
-            _LOGGER.error("Error sending command %s: %s", command, err)
+        if await self._async_send(
+            descriptor.render(), f"sending command {command}", descriptor.capability
+        ):
+            _LOGGER.debug("Command %s sent successfully", command)
+            if descriptor.capability == "switch":
+                # Let polling follow the power state we just requested, and
+                # keep it while the cloud catches up
+                power = descriptor.command == "on"
+                self._requested_power = (power, time.monotonic() + POWER_GRACE)
+                self._async_set_snapshot(replace(self._snapshot, power=power))
+            return True
+        return False
+    
+    async def async_send_to_component(self, component: str, command: str, *args: Any) -> bool:
+        """Send a command to a specific component, e.g. a soundbar."""
+        if (descriptor := lookup(COMMANDS, command)) is None:
+            _LOGGER.warning("Unknown command: %s", command)
             return False
+        return await self._async_send(
+            descriptor.for_component(component).render(*args),
+            f"sending {command} to {component}",
+            descriptor.capability,
+            component,
+        )
+    
+    @callback
+    def async_queue_command(self, command: str) -> None:
+        """Queue a key for sending without waiting for the API round trip.
+        
+        Queued keys are sent one at a time in order by a background worker.
+        """
+        self._key_queue.put_nowait(command)
+        self.tracer.record_queue_depth(self._key_queue.qsize())
+        if self._key_worker is None or self._key_worker.done():
+            self._key_worker = self.hass.async_create_background_task(
+                self._async_process_key_queue(),
+                f"samsung_remote key queue {self.device_id}",
+            )
+    
+    async def _async_process_key_queue(self) -> None:
+        """Send queued keys until the queue is drained."""
+        while not self._key_queue.empty():
+            command = self._key_queue.get_nowait()
+            try:
+                await self.send_command(command)
+            finally:
+                self._key_queue.task_done()
+    
+    async def async_shutdown(self) -> None:
+        """Stop background work of the bridge."""
+        if self._key_worker is not None and not self._key_worker.done():
+            self._key_worker.cancel()
+        self._key_worker = None
+        for handle in self._confirm_handles.values():
+            handle.cancel()
+        self._confirm_handles.clear()
+        self._listeners.clear()
+        self.health.async_shutdown()
     
     async def get_device_status(self) -> dict[str, Any]:
         """Get the current status of the device."""
-        token = self._get_access_token()
-        if not token:
-            return {}
+        return (await self.async_read_status()).status
+    
+    async def async_read_status(self, max_age: float = STATUS_MAX_AGE) -> StatusRead:
+        """Read the device status with single-flight semantics.
         
-        url = f"{SMARTTHINGS_API_BASE}/devices/{self.device_id}/status"
-        headers = {
-            "Authorization": f"Bearer {token}",
-            "Content-Type": "application/json",
-        }
+        A status fetched less than ``max_age`` seconds ago is reused, and
+        concurrent callers share one in-flight request instead of each
+        sending their own.
+        """
+        if self._cached_status and time.monotonic() - self._status_time < max_age:
+            self.tracer.record_status_read(STATUS_SOURCE_CACHE)
+            return StatusRead(self._cached_status, STATUS_SOURCE_CACHE)
         
+        if (task := self._status_task) is not None:
+            result = await asyncio.shield(task)
+            if result.source == STATUS_SOURCE_NETWORK:
+                result = StatusRead(result.status, STATUS_SOURCE_SHARED)
+            self.tracer.record_status_read(result.source)
+            return result
+        
+        task = self._status_task = asyncio.ensure_future(self._async_fetch_status())
+        task.add_done_callback(self._async_status_fetch_done)
+        # Shielded so one cancelled caller does not abort the shared fetch
+        result = await asyncio.shield(task)
+        self.tracer.record_status_read(result.source)
+        return result
+    
+    def _async_status_fetch_done(self, task: asyncio.Task[StatusRead]) -> None:
+        """Release the in-flight status fetch."""
+        if self._status_task is task:
+            self._status_task = None
+    
+    async def _async_fetch_status(self) -> StatusRead:
+        """Fetch the full status document from the API."""
+        response = await self._async_request("GET", self._url_status, STATUS_TIMEOUT)
+        if response is not None:
+            if response.ok:
+                # Decode fully before swapping so a cancelled poll
+                # never leaves a partial status behind
+                try:
+                    status = self._async_apply_status(response.body)
+                except ValueError as err:
+                    _LOGGER.warning("Invalid device status: %s", err)
+                else:
+                    self._status_time = time.monotonic()
+                    return StatusRead(status, STATUS_SOURCE_NETWORK)
+            else:
+                _LOGGER.warning("Failed to get device status: %s", response.status)
+        
+        # Fall back to the last known status
+        return StatusRead(self._cached_status, STATUS_SOURCE_STALE)
+    
+    @callback
+    def _async_apply_status(
+        self, body: bytes, component: str | None = None, capability: str | None = None
+    ) -> dict[str, Any]:
+        """Decode a status response, parse it and publish the snapshot.
+        
+        With a component and capability the body is the status of that
+        capability only, and is merged into the last full status document.
+        """
+        profiler = self.profiler
+        started = time.perf_counter() if profiler.enabled else 0.0
+        status = json_loads(body)
+        if started:
+            started = profiler.lap(STAGE_DECODE, started)
+        if capability is not None:
+            components = self._cached_status.get("components", {})
+            status = {
+                **self._cached_status,
+                "components": {
+                    **components,
+                    component: {**components.get(component, {}), capability: status},
+                },
+            }
+        snapshot = self._parser.parse(status)
+        if started:
+            profiler.lap(STAGE_PARSE, started)
+        
+        self._cached_status = status
+        if snapshot.channel is not None:
+            self.channels.async_learn(snapshot.channel, snapshot.channel_name)
+        self._async_set_snapshot(snapshot)
+        return status
+    
+    async def async_read_capability(
+        self, capability: str, component: str | None = None
+    ) -> TVSnapshot | None:
+        """Read the status of one capability and merge it into the snapshot.
+        
+        Uses the narrow per-capability endpoint, so targeted reads transfer
+        and decode a fraction of the full document. Falls back to a full
+        read while no full status is known, and reuses a full status read
+        less than STATUS_MAX_AGE seconds ago. Returns None if the read failed.
+        """
+        if not self._cached_status:
+            read = await self.async_read_status()
+            return None if read.source == STATUS_SOURCE_STALE else self._snapshot
+        if time.monotonic() - self._status_time < STATUS_MAX_AGE:
+            return self._snapshot
+        
+        component = component or self._capabilities.component_for(capability) or MAIN_COMPONENT
+        key = (component, capability)
+        if (task := self._capability_tasks.get(key)) is None:
+            task = self._capability_tasks[key] = asyncio.ensure_future(
+                self._async_fetch_capability(component, capability)
+            )
+            task.add_done_callback(lambda _: self._capability_tasks.pop(key, None))
+        # Shared by concurrent readers of the same capability
+        return await asyncio.shield(task)
+    
+    async def _async_fetch_capability(self, component: str, capability: str) -> TVSnapshot | None:
+        """Fetch one capability status from the API."""
+        response = await self._async_request(
+            "GET",
+            f"{self._url_device}/components/{component}/capabilities/{capability}/status",
+            STATUS_TIMEOUT,
+        )
+        if response is None or not response.ok:
+            _LOGGER.warning(
+                "Failed to get %s status: %s",
+                capability,
+                response.status if response is not None else "no response",
+            )
+            return None
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, headers=headers) as response:
-                    if response.status == 200:
-                        self._cached_status = await response.json()
-                        return self._cached_status
-                    else:
-                        _LOGGER.warning("Failed to get device status: %s", response.status)
-                        return self._cached_status
-        except Exception as err:
-            _LOGGER.error("Error getting device status: %s", err)
-            return self._cached_status
+            self._async_apply_status(response.body, component, capability)
+        except ValueError as err:
+            _LOGGER.warning("Invalid %s status: %s", capability, err)
+            return None
+        return self._snapshot
+    
+    async def _async_read_narrow(self, *capabilities: str) -> TVSnapshot:
+        """Return the snapshot after reading the first supported capability.
+        
+        Reads the full status if the device supports none of them.
+        """
+        for capability in capabilities:
+            if self._capabilities.component_for(capability) is not None:
+                if (snapshot := await self.async_read_capability(capability)) is not None:
+                    return snapshot
+                break
+        return await self.async_get_snapshot()
+    
+    async def async_read_power(self) -> bool | None:
+        """Read only the power state, e.g. for polling a TV that is off.
+        
+        Returns None if the read failed.
+        """
+        if (snapshot := await self.async_read_capability("switch")) is None:
+            return None
+        return snapshot.power
+    
+    async def async_get_snapshot(self) -> TVSnapshot:
+        """Return the parsed device state, reading status if needed."""
+        await self.async_read_status()
+        return self._snapshot
     
     async def get_power_state(self) -> bool:
         """Get the power state of the TV."""
-        status = await self.get_device_status()
-        try:
-            switch_status = status.get("components", {}).get("main", {}).get("switch", {})
-            return switch_status.get("switch", {}).get("value") == "on"
-        except (KeyError, TypeError):
-            return False
+        return (await self._async_read_narrow("switch")).power
     
     async def get_mute_state(self) -> bool:
         """Get the mute state of the TV."""
-        status = await self.get_device_status()
-        try:
-            mute_status = status.get("components", {}).get("main", {}).get("audioMute", {})
-            return mute_status.get("mute", {}).get("value") == "muted"
-        except (KeyError, TypeError):
-            return False
+        return (await self._async_read_narrow("audioMute")).muted
     
     async def get_volume(self) -> int | None:
         """Get the current volume level."""
-        status = await self.get_device_status()
-        try:
-            volume_status = status.get("components", {}).get("main", {}).get("audioVolume", {})
-            return volume_status.get("volume", {}).get("value")
-        except (KeyError, TypeError):
-            return None
+        return (await self._async_read_narrow("audioVolume")).volume
     
     async def set_volume(self, volume: int) -> bool:
         """Set the volume level."""
-        token = self._get_access_token()
-        if not token:
-            return False
-        
-        url = f"{SMARTTHINGS_API_BASE}/devices/{self.device_id}/commands"
-        headers = {
-            "Authorization": f"Bearer {token}",
-            "Content-Type": "application/json",
-        }
-        
-        payload = {
-            "commands": [
-                {
-                    "component": "main",
-                    "capability": "audioVolume",
-                    "command": "setVolume",
-                    "arguments": [volume],
-                }
-            ]
-        }
-        
-        try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(url, headers=headers, json=payload) as response:
-                    return response.status == 200
-        except Exception as err:
-            _LOGGER.error("Error setting volume: %s", err)
-            return False
+        return await self._async_run_latest(
+            "volume",
+            self._async_send(
+                self._commands["SET_VOLUME"].render(volume), "setting volume", "audioVolume"
+            ),
+        )
     
     async def get_channel(self) -> int | None:
         """Get the current channel number."""
-        status = await self.get_device_status()
-        try:
-            channel_status = status.get("components", {}).get("main", {}).get("tvChannel", {})
-            channel = channel_status.get("tvChannel", {}).get("value")
-            if channel:
-                try:
-                    return int(channel)
-                except (ValueError, TypeError):
-                    return None
-            return None
-        except (KeyError, TypeError):
-            return None
+        return (await self._async_read_narrow("tvChannel")).channel
     
     async def set_channel(self, channel: int) -> bool:
-        """Set the TV channel."""
-        token = self._get_access_token()
-        if not token:
+        """Tune to a channel.
+        
+        Channels missing from an imported lineup are rejected without a
+        request. Superseded by a newer channel target.
+        """
+        if not self.channels.is_valid(channel):
+            _LOGGER.warning("Channel %s is not in the channel lineup", channel)
             return False
+        return await self._async_run_latest("channel", self._async_tune(channel))
+    
+    async def _async_tune(self, channel: int) -> bool:
+        """Tune with setTvChannel, falling back to a batch of digit keys.
         
-        url = f"{SMARTTHINGS_API_BASE}/devices/{self.device_id}/commands"
-        headers = {
-            "Authorization": f"Bearer {token}",
-            "Content-Type": "application/json",
-        }
-        
-        payload = {
-            "commands": [
-                {
-                    "component": "main",
-                    "capability": "tvChannel",
-                    "command": "setTvChannel",
-                    "arguments": [str(channel)],
-                }
-            ]
-        }
+        Only a TV that rejects setTvChannel is tuned with digit keys, and
+        then keeps using them. After a timeout or server error the command
+        may still have reached the TV, so it is not repeated as digits.
+        """
+        if self._channel_direct:
+            response = await self._async_post_command(
+                self._commands["SET_CHANNEL"].render(str(channel)),
+                "setting channel",
+                "tvChannel",
+            )
+            if response is None or response.status not in CHANNEL_REJECTED_STATUSES:
+                return response is not None and response.ok
         
-        try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(url, headers=headers, json=payload) as response:
-                    return response.status == 200
-        except Exception as err:
-            _LOGGER.error("Error setting channel: %s", err)
+        body = render_batch(
+            [*(self._commands[digit] for digit in str(channel)), self._commands["ENTER"]]
+        )
+        if not await self._async_send(body, "sending channel digits", "tvChannel"):
             return False
+        if self._channel_direct:
+            _LOGGER.debug("Tuning %s with digit keys from now on", self.device_id)
+            self._channel_direct = False
+        return True
+    
+    async def async_select_source(self, source: str) -> bool:
+        """Switch to an input source by display name or ID.
+        
+        Uses a single setInputSource command when the TV reports its
+        sources, and the source's remote key otherwise.
+        """
+        catalog = self._parser.sources
+        if catalog.command is None:
+            return await self.send_command(source)
+        
+        source_id = catalog.by_name.get(source, source)
+        return await self._async_run_latest(
+            "source",
+            self._async_send(
+                self._commands[catalog.command].render(source_id),
+                f"setting input source {source}",
+                # The current source is reported by mediaInputSource only
+                "mediaInputSource",
+            ),
+        )
+    
+    async def async_launch_app(self, app: str) -> bool:
+        """Launch an app by name from KNOWN_APPS or by its Tizen app ID."""
+        app_id = KNOWN_APPS.get(app, app)
+        return await self._async_run_latest(
+            "app",
+            self._async_send(self._commands["LAUNCH_APP"].render(app_id), f"launching app {app}"),
+        )
     
     async def get_input_source(self) -> str | None:
         """Get the current input source."""
-        status = await self.get_device_status()
-        try:
-            input_status = status.get("components", {}).get("main", {}).get("mediaInputSource", {})
-            return input_status.get("inputSource", {}).get("value")
-        except (KeyError, TypeError):
-            return None
+        return (await self._async_read_narrow("mediaInputSource")).input_source
     
     async def get_current_activity(self) -> str | None:
         """Get the current activity (playing, paused, etc.)."""
-        status = await self.get_device_status()
-        try:
-            playback_status = status.get("components", {}).get("main", {}).get("mediaPlayback", {})
-            return playback_status.get("playbackStatus", {}).get("value")
-        except (KeyError, TypeError):
-            return None
+        return (await self._async_read_narrow("mediaPlayback")).playback_status
     
     async def get_media_title(self) -> str | None:
         """Get the current media title."""
-        status = await self.get_device_status()
-        try:
-            # Try mediaTrackData first
-            track_data = status.get("components", {}).get("main", {}).get("mediaTrackData", {})
-            title = track_data.get("mediaTrackData", {}).get("value", {})
-            if isinstance(title, dict):
-                return title.get("title")
-            return None
-        except (KeyError, TypeError):
-            return None
+        return (await self._async_read_narrow("mediaTrackData")).media_title
     
     async def get_current_app(self) -> str | None:
         """Get the current running app."""
-        status = await self.get_device_status()
-        try:
-            # Try different capability names that Samsung TVs might use
-            for cap_name in ["samsungvd.launchApp", "custom.launchApp", "mediaInputSource"]:
-                app_status = status.get("components", {}).get("main", {}).get(cap_name, {})
-                if app_status:
-                    for key in ["appName", "currentApp", "inputSource"]:
-                        app = app_status.get(key, {}).get("value")
-                        if app:
-                            return app
-            return None
-        except (KeyError, TypeError):
-            return None
+        return (await self.async_get_snapshot()).app
+
+
+def _device_store(hass: HomeAssistant, device_id: str) -> Store[dict[str, Any]]:
+    """Return the store holding the description of a device."""
+    return Store(hass, DEVICE_STORAGE_VERSION, f"{DOMAIN}.device.{device_id}")
+
+
+async def async_remove_device_info(hass: HomeAssistant, device_id: str) -> None:
+    """Remove the stored description of a removed device."""
+    await _device_store(hass, device_id).async_remove()
 
 
 async def get_smartthings_token(hass: HomeAssistant, entry: ConfigEntry) -> str | None:
@@ -406,25 +893,72 @@ async def get_smartthings_token(hass: HomeAssistant, entry: ConfigEntry) -> str
     return None
 
 
-async def fetch_all_devices(token: str) -> list[dict[str, Any]]:
-    """Fetch all devices from SmartThings API."""
-    url = f"{SMARTTHINGS_API_BASE}/devices"
+async def async_iter_device_pages(
+    session: aiohttp.ClientSession,
+    token: str,
+) -> AsyncIterator[list[dict[str, Any]]]:
+    """Yield the SmartThings device list one page at a time.
+    
+    Follows the ``_links.next`` cursor so only a single page of full device
+    dicts is held in memory at any point.
+    """
+    url: str | None = f"{SMARTTHINGS_API_BASE}/devices"
     headers = {
         "Authorization": f"Bearer {token}",
         "Content-Type": "application/json",
     }
     
-    devices = []
-    
-    async with aiohttp.ClientSession() as session:
-        async with session.get(url, headers=headers) as response:
-            if response.status == 200:
-                data = await response.json()
-                devices = data.get("items", [])
-            else:
+    while url:
+        async with session.get(url, headers=headers, timeout=DISCOVERY_TIMEOUT) as response:
+            if response.status != 200:
                 _LOGGER.error("Failed to fetch devices: %s", response.status)
+                return
+            page = json_loads(await response.read())
+        
+        url = ((page.get("_links") or {}).get("next") or {}).get("href")
+        yield page.get("items", [])
+
+
+def compact_tv_record(device: dict[str, Any]) -> dict[str, Any]:
+    """Reduce a full SmartThings device dict to the fields kept for a TV."""
+    capabilities = {
+        cap.get("id", "") if isinstance(cap, dict) else str(cap)
+        for component in device.get("components", [])
+        for cap in component.get("capabilities", [])
+    }
+    return {
+        "id": device.get("deviceId"),
+        "name": device.get("label") or device.get("name") or "Samsung TV",
+        "manufacturer": device.get("manufacturerName", "Samsung"),
+        "model": device.get("deviceTypeName", "TV"),
+        "capabilities": sorted(capabilities),
+    }
+
+
+async def fetch_samsung_tvs(
+    session: aiohttp.ClientSession,
+    token: str,
+) -> list[dict[str, Any]]:
+    """Fetch the Samsung TVs in the account as compact records.
+    
+    Each page is filtered as soon as it is decoded and its full device
+    dicts are dropped before the next page is requested.
+    """
+    tvs: list[dict[str, Any]] = []
     
-    return devices
+    try:
+        async for devices in async_iter_device_pages(session, token):
+            tvs.extend(
+                compact_tv_record(device)
+                for device in devices
+                if is_samsung_tv(device)
+            )
+    except asyncio.TimeoutError:
+        _LOGGER.error("Timed out fetching devices from SmartThings")
+    except aiohttp.ClientError as err:
+        _LOGGER.error("Error fetching devices from SmartThings: %s", err)
+    
+    return tvs
 
 
 def is_samsung_tv(device: dict[str, Any]) -> bool:
@@ -491,7 +1025,7 @@ def is_samsung_tv(device: dict[str, Any]) -> bool:
 async def get_samsung_tvs_from_api(
     hass: HomeAssistant, 
     smartthings_entry: ConfigEntry
-) -> list[dict[str, str]]:
+) -> list[dict[str, Any]]:
     """Get Samsung TVs directly from SmartThings API."""
     token = await get_smartthings_token(hass, smartthings_entry)
     
@@ -499,17 +1033,7 @@ async def get_samsung_tvs_from_api(
         _LOGGER.error("No SmartThings token available")
         return []
     
-    devices = await fetch_all_devices(token)
-    tvs = []
-    
-    for device in devices:
-        if is_samsung_tv(device):
-            tvs.append({
-                "id": device.get("deviceId"),
-                "name": device.get("label") or device.get("name") or "Samsung TV",
-                "manufacturer": device.get("manufacturerName", "Samsung"),
-                "model": device.get("deviceTypeName", "TV"),
-            })
+    tvs = await fetch_samsung_tvs(async_get_clientsession(hass), token)
     
     _LOGGER.info("Found %d Samsung TV(s) in SmartThings account", len(tvs))
     return tvs
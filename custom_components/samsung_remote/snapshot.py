@@ -0,0 +1,180 @@
+"""Parsed device state for Samsung TV Remote integration."""
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass
+from typing import Any
+
+from .capabilities import MAIN_COMPONENT, CapabilityIndex
+from .catalog import DEFAULT_SOURCES, SourceCatalog, update_source_catalog
+
+# Capabilities and attributes a Samsung TV may report its running app under
+APP_CAPABILITIES = ("samsungvd.launchApp", "custom.launchApp", "mediaInputSource")
+APP_ATTRIBUTES = ("appName", "currentApp", "inputSource")
+
+# Capabilities the device-level snapshot is read from
+SNAPSHOT_CAPABILITIES = (
+    "switch",
+    "audioMute",
+    "audioVolume",
+    "tvChannel",
+    "mediaInputSource",
+    "samsungvd.mediaInputSource",
+    "mediaPlayback",
+    "mediaTrackData",
+    *APP_CAPABILITIES,
+)
+
+# Capabilities that get a component snapshot when a further component has them
+COMPONENT_CAPABILITIES = ("switch", "audioMute", "audioVolume")
+
+
+@dataclass(frozen=True, slots=True)
+class ComponentSnapshot:
+    """State of a further component, e.g. a soundbar."""
+    
+    component: str
+    power: bool | None = None
+    muted: bool | None = None
+    volume: int | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class TVSnapshot:
+    """Compact view of one status document."""
+    
+    power: bool = False
+    muted: bool = False
+    volume: int | None = None
+    channel: int | None = None
+    channel_name: str | None = None
+    input_source: str | None = None
+    playback_status: str | None = None
+    media_title: str | None = None
+    app: str | None = None
+    sources: tuple[str, ...] = ()
+    components: tuple[ComponentSnapshot, ...] = ()
+    
+    def as_dict(self) -> dict[str, Any]:
+        """Return the snapshot as a JSON-serializable dict."""
+        return asdict(self)
+    
+    def component(self, component: str) -> ComponentSnapshot | None:
+        """Return the snapshot of a further component."""
+        for component_snapshot in self.components:
+            if component_snapshot.component == component:
+                return component_snapshot
+        return None
+
+
+def _value(component: Any, capability: str, attribute: str) -> Any:
+    """Return an attribute value from a status component."""
+    if not isinstance(component, dict):
+        return None
+    cap_status = component.get(capability)
+    if not isinstance(cap_status, dict):
+        return None
+    attr_status = cap_status.get(attribute)
+    if not isinstance(attr_status, dict):
+        return None
+    return attr_status.get("value")
+
+
+def _parse_channel(value: Any) -> int | None:
+    """Return the channel as a number if it is one."""
+    if not value:
+        return None
+    try:
+        return int(value)
+    except (ValueError, TypeError):
+        return None
+
+
+class StatusParser:
+    """Parse the status documents of one TV.
+    
+    The component each capability is read from is resolved once from the
+    capability index, so one status document fills the device-level fields
+    from whichever component provides them plus a snapshot per further
+    component. The input source catalog is kept between polls and only
+    rebuilt when the TV reports a different list.
+    """
+    
+    __slots__ = ("_where", "_app_capabilities", "_components", "sources")
+    
+    def __init__(self, index: CapabilityIndex | None = None) -> None:
+        """Initialize the parser for a device."""
+        index = index or CapabilityIndex()
+        self._where = {
+            capability: index.component_for(capability) or MAIN_COMPONENT
+            for capability in SNAPSHOT_CAPABILITIES
+        }
+        self._app_capabilities = tuple(
+            capability for capability in APP_CAPABILITIES if index.component_for(capability)
+        ) or APP_CAPABILITIES
+        
+        secondary: dict[str, set[str]] = {}
+        for capability in COMPONENT_CAPABILITIES:
+            for component in index.secondary_components(capability):
+                secondary.setdefault(component, set()).add(capability)
+        self._components = tuple(
+            (component, frozenset(capabilities)) for component, capabilities in secondary.items()
+        )
+        self.sources: SourceCatalog = DEFAULT_SOURCES
+    
+    def _get(self, components: dict[str, Any], capability: str, attribute: str) -> Any:
+        """Return an attribute from the component providing the capability."""
+        return _value(components.get(self._where[capability]), capability, attribute)
+    
+    def _parse_app(self, components: dict[str, Any]) -> str | None:
+        """Return the running app from whichever capability reports it."""
+        for capability in self._app_capabilities:
+            for attribute in APP_ATTRIBUTES:
+                if app := self._get(components, capability, attribute):
+                    return app
+        return None
+    
+    def _parse_component(
+        self,
+        components: dict[str, Any],
+        component: str,
+        capabilities: frozenset[str],
+    ) -> ComponentSnapshot:
+        """Parse the state of a further component."""
+        status = components.get(component)
+        return ComponentSnapshot(
+            component=component,
+            power=_value(status, "switch", "switch") == "on" if "switch" in capabilities else None,
+            muted=_value(status, "audioMute", "mute") == "muted" if "audioMute" in capabilities else None,
+            volume=_value(status, "audioVolume", "volume") if "audioVolume" in capabilities else None,
+        )
+    
+    def parse(self, status: dict[str, Any]) -> TVSnapshot:
+        """Parse a full device status document into a snapshot."""
+        components = status.get("components") if isinstance(status, dict) else None
+        if not isinstance(components, dict):
+            return TVSnapshot(sources=self.sources.names)
+        
+        get = self._get
+        self.sources = update_source_catalog(
+            self.sources,
+            get(components, "samsungvd.mediaInputSource", "supportedInputSourcesMap"),
+            get(components, "mediaInputSource", "supportedInputSources"),
+        )
+        track_data = get(components, "mediaTrackData", "mediaTrackData")
+        
+        return TVSnapshot(
+            power=get(components, "switch", "switch") == "on",
+            muted=get(components, "audioMute", "mute") == "muted",
+            volume=get(components, "audioVolume", "volume"),
+            channel=_parse_channel(get(components, "tvChannel", "tvChannel")),
+            channel_name=get(components, "tvChannel", "tvChannelName") or None,
+            input_source=get(components, "mediaInputSource", "inputSource"),
+            playback_status=get(components, "mediaPlayback", "playbackStatus"),
+            media_title=track_data.get("title") if isinstance(track_data, dict) else None,
+            app=self._parse_app(components),
+            sources=self.sources.names,
+            components=tuple(
+                self._parse_component(components, component, capabilities)
+                for component, capabilities in self._components
+            ),
+        )
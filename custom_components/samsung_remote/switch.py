@@ -1,16 +1,18 @@
 """Switch entities for Samsung TV Remote integration."""
 from __future__ import annotations
 
+from abc import abstractmethod
 import logging
 from typing import Any
 
 from homeassistant.components.switch import SwitchEntity, SwitchDeviceClass
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import DOMAIN, CONF_DEVICE_ID, CONF_DEVICE_NAME
+from .const import DOMAIN
+from .entity import SamsungTVContext, SamsungTVEntity
+from .snapshot import ComponentSnapshot, TVSnapshot
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -21,49 +23,43 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Samsung TV Remote switch entities from a config entry."""
-    data = hass.data[DOMAIN][entry.entry_id]
-    bridge = data["bridge"]
-    device_id = data["device_id"]
-    device_name = entry.data.get(CONF_DEVICE_NAME, "Samsung TV")
-    
-    entities = [
-        SamsungTVPowerSwitch(bridge, device_id, device_name),
-        SamsungTVMuteSwitch(bridge, device_id, device_name),
+    tv = hass.data[DOMAIN][entry.entry_id]["context"]
+    
+    entities: list[SwitchEntity] = [
+        SamsungTVPowerSwitch(tv),
+        SamsungTVMuteSwitch(tv),
     ]
     
+    # Further components, e.g. a soundbar, get switches of their own
+    capabilities = tv.bridge.capabilities
+    entities.extend(
+        SamsungTVComponentPowerSwitch(tv, component)
+        for component in capabilities.secondary_components("switch")
+    )
+    entities.extend(
+        SamsungTVComponentMuteSwitch(tv, component)
+        for component in capabilities.secondary_components("audioMute")
+    )
+    
     async_add_entities(entities)
 
 
-class SamsungTVPowerSwitch(SwitchEntity):
+class SamsungTVPowerSwitch(SamsungTVEntity, SwitchEntity):
     """Samsung TV power switch entity."""
     
-    _attr_has_entity_name = True
     _attr_name = "Power"
     _attr_icon = "mdi:power"
     _attr_device_class = SwitchDeviceClass.SWITCH
+    _attr_is_on = False
     
-    def __init__(
-        self,
-        bridge,
-        device_id: str,
-        device_name: str,
-    ) -> None:
+    def __init__(self, tv: SamsungTVContext) -> None:
         """Initialize the power switch entity."""
-        self._bridge = bridge
-        self._device_id = device_id
-        self._device_name = device_name
-        self._attr_unique_id = f"{device_id}_power_switch"
-        self._attr_is_on = False
-    
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._device_id)},
-            name=self._device_name,
-            manufacturer="Samsung",
-            model="Smart TV",
-        )
+        super().__init__(tv, "power_switch")
+    
+    @callback
+    def _update_from_snapshot(self, snapshot: TVSnapshot) -> None:
+        """Update the power state from a snapshot."""
+        self._attr_is_on = snapshot.power
     
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn on the TV."""
@@ -76,41 +72,24 @@ class SamsungTVPowerSwitch(SwitchEntity):
         if await self._bridge.send_command("POWER_OFF"):
             self._attr_is_on = False
             self.async_write_ha_state()
-    
-    async def async_update(self) -> None:
-        """Update the entity state."""
-        self._attr_is_on = await self._bridge.get_power_state()
 
 
-class SamsungTVMuteSwitch(SwitchEntity):
+class SamsungTVMuteSwitch(SamsungTVEntity, SwitchEntity):
     """Samsung TV mute switch entity."""
     
-    _attr_has_entity_name = True
     _attr_name = "Mute"
+    _requires_power = True
     _attr_icon = "mdi:volume-mute"
+    _attr_is_on = False
     
-    def __init__(
-        self,
-        bridge,
-        device_id: str,
-        device_name: str,
-    ) -> None:
+    def __init__(self, tv: SamsungTVContext) -> None:
         """Initialize the mute switch entity."""
-        self._bridge = bridge
-        self._device_id = device_id
-        self._device_name = device_name
-        self._attr_unique_id = f"{device_id}_mute_switch"
-        self._attr_is_on = False
-    
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._device_id)},
-            name=self._device_name,
-            manufacturer="Samsung",
-            model="Smart TV",
-        )
+        super().__init__(tv, "mute_switch")
+    
+    @callback
+    def _update_from_snapshot(self, snapshot: TVSnapshot) -> None:
+        """Update the mute state from a snapshot."""
+        self._attr_is_on = snapshot.muted
     
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Mute the TV."""
@@ -123,7 +102,73 @@ class SamsungTVMuteSwitch(SwitchEntity):
         if await self._bridge.send_command("UNMUTE"):
             self._attr_is_on = False
             self.async_write_ha_state()
+
+
+class SamsungTVComponentSwitch(SamsungTVEntity, SwitchEntity):
+    """Switch of a further component of the device."""
+    
+    _attr_is_on = False
+    _on_command: str
+    _off_command: str
+    
+    def __init__(self, tv: SamsungTVContext, component: str, suffix: str) -> None:
+        """Initialize the component switch entity."""
+        self._component = component
+        super().__init__(tv, f"{component}_{suffix}")
+    
+    @abstractmethod
+    def _state_from(self, component: ComponentSnapshot) -> bool | None:
+        """Return the switch state from the component snapshot."""
+    
+    @callback
+    def _update_from_snapshot(self, snapshot: TVSnapshot) -> None:
+        """Update the state from the component snapshot."""
+        if (component := snapshot.component(self._component)) is not None:
+            self._attr_is_on = bool(self._state_from(component))
+    
+    async def async_turn_on(self, **kwargs: Any) -> None:
+        """Turn the switch on."""
+        if await self._bridge.async_send_to_component(self._component, self._on_command):
+            self._attr_is_on = True
+            self.async_write_ha_state()
+    
+    async def async_turn_off(self, **kwargs: Any) -> None:
+        """Turn the switch off."""
+        if await self._bridge.async_send_to_component(self._component, self._off_command):
+            self._attr_is_on = False
+            self.async_write_ha_state()
+
+
+class SamsungTVComponentPowerSwitch(SamsungTVComponentSwitch):
+    """Power switch of a further component."""
+    
+    _attr_icon = "mdi:power"
+    _attr_device_class = SwitchDeviceClass.SWITCH
+    _on_command = "POWER_ON"
+    _off_command = "POWER_OFF"
+    
+    def __init__(self, tv: SamsungTVContext, component: str) -> None:
+        """Initialize the component power switch entity."""
+        super().__init__(tv, component, "power_switch")
+        self._attr_name = f"{component} Power"
+    
+    def _state_from(self, component: ComponentSnapshot) -> bool | None:
+        """Return the power state."""
+        return component.power
+
+
+class SamsungTVComponentMuteSwitch(SamsungTVComponentSwitch):
+    """Mute switch of a further component."""
+    
+    _attr_icon = "mdi:volume-mute"
+    _on_command = "MUTE"
+    _off_command = "UNMUTE"
+    
+    def __init__(self, tv: SamsungTVContext, component: str) -> None:
+        """Initialize the component mute switch entity."""
+        super().__init__(tv, component, "mute_switch")
+        self._attr_name = f"{component} Mute"
     
-    async def async_update(self) -> None:
-        """Update the entity state."""
-        self._attr_is_on = await self._bridge.get_mute_state()
+    def _state_from(self, component: ComponentSnapshot) -> bool | None:
+        """Return the mute state."""
+        return component.muted
@@ -0,0 +1,129 @@
+"""Request and state tracing for Samsung TV Remote diagnostics.
+
+Everything here is kept in fixed-size ring buffers and counters, so tracing
+stays enabled in production without growing memory.
+"""
+from __future__ import annotations
+
+from collections import Counter, deque
+from dataclasses import fields
+from typing import Any, NamedTuple
+
+from homeassistant.util import dt as dt_util
+
+from .const import TRACE_REQUESTS, TRACE_SNAPSHOTS
+from .snapshot import TVSnapshot
+
+SNAPSHOT_FIELDS = tuple(field.name for field in fields(TVSnapshot))
+
+
+class RequestTrace(NamedTuple):
+    """One request sent through the bridge pipeline."""
+    
+    time: float
+    method: str
+    endpoint: str
+    status: int | None
+    latency: float
+    retries: int
+    error: str | None
+    
+    def as_dict(self) -> dict[str, Any]:
+        """Return the trace as a JSON-serializable dict."""
+        return {
+            "time": dt_util.utc_from_timestamp(self.time).isoformat(),
+            "method": self.method,
+            "endpoint": self.endpoint,
+            "status": self.status,
+            "latency_ms": round(self.latency * 1000, 1),
+            "retries": self.retries,
+            "error": self.error,
+        }
+
+
+class SnapshotTrace(NamedTuple):
+    """A snapshot change and the fields that changed."""
+    
+    time: float
+    snapshot: TVSnapshot
+    changes: dict[str, tuple[Any, Any]]
+    
+    def as_dict(self) -> dict[str, Any]:
+        """Return the trace as a JSON-serializable dict."""
+        return {
+            "time": dt_util.utc_from_timestamp(self.time).isoformat(),
+            "snapshot": self.snapshot.as_dict(),
+            "changes": {
+                field: {"from": old, "to": new}
+                for field, (old, new) in self.changes.items()
+            },
+        }
+
+
+def snapshot_changes(old: TVSnapshot, new: TVSnapshot) -> dict[str, tuple[Any, Any]]:
+    """Return the fields that differ between two snapshots."""
+    return {
+        field: (old_value, new_value)
+        for field in SNAPSHOT_FIELDS
+        if (old_value := getattr(old, field)) != (new_value := getattr(new, field))
+    }
+
+
+class BridgeTracer:
+    """Recent requests, snapshot changes and counters of one bridge."""
+    
+    __slots__ = ("requests", "snapshots", "counters", "queue_high_water")
+    
+    def __init__(self) -> None:
+        """Initialize the tracer."""
+        self.requests: deque[RequestTrace] = deque(maxlen=TRACE_REQUESTS)
+        self.snapshots: deque[SnapshotTrace] = deque(maxlen=TRACE_SNAPSHOTS)
+        self.counters: Counter[str] = Counter()
+        self.queue_high_water = 0
+    
+    def record_request(
+        self,
+        method: str,
+        endpoint: str,
+        status: int | None,
+        latency: float,
+        retries: int,
+        error: str | None = None,
+    ) -> None:
+        """Record a finished request."""
+        self.requests.append(
+            RequestTrace(dt_util.utcnow().timestamp(), method, endpoint, status, latency, retries, error)
+        )
+        self.counters["requests"] += 1
+        self.counters["retries"] += retries
+        if status != 200:
+            self.counters["request_errors"] += 1
+    
+    def record_snapshot(self, old: TVSnapshot, new: TVSnapshot) -> None:
+        """Record a snapshot change."""
+        self.snapshots.append(
+            SnapshotTrace(dt_util.utcnow().timestamp(), new, snapshot_changes(old, new))
+        )
+    
+    def record_status_read(self, source: str) -> None:
+        """Count a status read by the source it was served from."""
+        self.counters[f"status_{source}"] += 1
+    
+    def record_queue_depth(self, depth: int) -> None:
+        """Track the deepest the key queue has been."""
+        if depth > self.queue_high_water:
+            self.queue_high_water = depth
+    
+    def as_dict(self) -> dict[str, Any]:
+        """Return the collected traces as a JSON-serializable dict."""
+        latencies = sorted(trace.latency for trace in self.requests)
+        return {
+            "counters": dict(self.counters),
+            "queue_high_water": self.queue_high_water,
+            "recent_latency_ms": {
+                "median": round(latencies[len(latencies) // 2] * 1000, 1),
+                "max": round(latencies[-1] * 1000, 1),
+            } if latencies else None,
+            "requests": [trace.as_dict() for trace in self.requests],
+            "snapshots": [trace.as_dict() for trace in self.snapshots],
+        }
@@ -0,0 +1,167 @@
+"""WebSocket API for Samsung TV Remote integration.
+
+Lets clients such as the web remote send keys and follow the TV state over
+their existing Home Assistant websocket connection instead of issuing a
+REST service call per key.
+"""
+from __future__ import annotations
+
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.components import websocket_api
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
+
+from .commands import KEY_SET
+from .const import DOMAIN, HOLD_ACCELERATION
+from .smartthings_bridge import SmartThingsBridge
+from .snapshot import TVSnapshot
+
+TARGET_SCHEMA = {
+    vol.Exclusive("entry_id", "target"): str,
+    vol.Exclusive("entity_id", "target"): str,
+}
+
+
+@callback
+def async_setup_websocket_api(hass: HomeAssistant) -> None:
+    """Register the websocket commands."""
+    websocket_api.async_register_command(hass, ws_send_key)
+    websocket_api.async_register_command(hass, ws_subscribe_state)
+    websocket_api.async_register_command(hass, ws_press_start)
+    websocket_api.async_register_command(hass, ws_press_end)
+
+
+@callback
+def _async_get_entry_data(hass: HomeAssistant, msg: dict[str, Any]) -> dict[str, Any] | None:
+    """Resolve the entry data a message targets by entry or entity ID."""
+    entry_id = msg.get("entry_id")
+    if entity_id := msg.get("entity_id"):
+        entity_entry = er.async_get(hass).async_get(entity_id)
+        if entity_entry is None or entity_entry.platform != DOMAIN:
+            return None
+        entry_id = entity_entry.config_entry_id
+    
+    return hass.data.get(DOMAIN, {}).get(entry_id)
+
+
+@callback
+def _async_get_bridge(hass: HomeAssistant, msg: dict[str, Any]) -> SmartThingsBridge | None:
+    """Resolve the bridge a message targets."""
+    data = _async_get_entry_data(hass, msg)
+    return data["bridge"] if data else None
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "samsung_remote/send_key",
+        vol.Required("key"): str,
+        **TARGET_SCHEMA,
+    }
+)
+@callback
+def ws_send_key(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Queue a key and acknowledge before the cloud round trip."""
+    bridge = _async_get_bridge(hass, msg)
+    if bridge is None:
+        connection.send_error(msg["id"], websocket_api.ERR_NOT_FOUND, "Samsung TV not found")
+        return
+    
+    key = msg["key"].upper()
+    if key not in KEY_SET:
+        connection.send_error(msg["id"], websocket_api.ERR_INVALID_FORMAT, f"Unknown key: {key}")
+        return
+    
+    bridge.async_queue_command(key)
+    connection.send_result(msg["id"])
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "samsung_remote/subscribe_state",
+        **TARGET_SCHEMA,
+    }
+)
+@callback
+def ws_subscribe_state(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Stream snapshot changes, starting with the current one."""
+    bridge = _async_get_bridge(hass, msg)
+    if bridge is None:
+        connection.send_error(msg["id"], websocket_api.ERR_NOT_FOUND, "Samsung TV not found")
+        return
+    
+    @callback
+    def forward_snapshot(snapshot: TVSnapshot) -> None:
+        connection.send_message(websocket_api.event_message(msg["id"], snapshot.as_dict()))
+    
+    connection.subscriptions[msg["id"]] = bridge.async_add_listener(forward_snapshot)
+    connection.send_result(msg["id"])
+    forward_snapshot(bridge.snapshot)
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "samsung_remote/press_start",
+        vol.Required("key"): str,
+        vol.Optional("acceleration", default=HOLD_ACCELERATION): vol.All(
+            vol.Coerce(float), vol.Range(min=1.0, max=3.0)
+        ),
+        **TARGET_SCHEMA,
+    }
+)
+@callback
+def ws_press_start(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Start holding a key."""
+    data = _async_get_entry_data(hass, msg)
+    if data is None:
+        connection.send_error(msg["id"], websocket_api.ERR_NOT_FOUND, "Samsung TV not found")
+        return
+    
+    key = msg["key"].upper()
+    if key not in KEY_SET:
+        connection.send_error(msg["id"], websocket_api.ERR_INVALID_FORMAT, f"Unknown key: {key}")
+        return
+    
+    # Release the hold if the connection drops before press_end; repeated
+    # press_starts renewing the lease replace the entry instead of adding one
+    connection.subscriptions[(DOMAIN, "hold", data["device_id"], key)] = (
+        data["hold"].async_press_start(key, msg["acceleration"])
+    )
+    connection.send_result(msg["id"])
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "samsung_remote/press_end",
+        vol.Required("key"): str,
+        **TARGET_SCHEMA,
+    }
+)
+@websocket_api.async_response
+async def ws_press_end(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Release a held key once its final command is sent."""
+    data = _async_get_entry_data(hass, msg)
+    if data is None:
+        connection.send_error(msg["id"], websocket_api.ERR_NOT_FOUND, "Samsung TV not found")
+        return
+    
+    await data["hold"].async_press_end(msg["key"])
+    connection.send_result(msg["id"])
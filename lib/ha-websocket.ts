@@ -0,0 +1,137 @@
+export interface ComponentState {
+  component: string
+  power: boolean | null
+  muted: boolean | null
+  volume: number | null
+}
+
+export interface TVState {
+  power: boolean
+  muted: boolean
+  volume: number | null
+  channel: number | null
+  channel_name: string | null
+  input_source: string | null
+  playback_status: string | null
+  media_title: string | null
+  app: string | null
+  sources: string[]
+  components: ComponentState[]
+}
+
+type Pending = {
+  resolve: (result: unknown) => void
+  reject: (error: Error) => void
+}
+
+type Listener = (event: unknown) => void
+
+/**
+ * Minimal Home Assistant websocket client.
+ *
+ * Keeps one authenticated connection open so every key press is a small
+ * message instead of a separate REST request.
+ */
+export class HomeAssistantSocket {
+  private socket: WebSocket | null = null
+  private ready: Promise<void> | null = null
+  private nextId = 1
+  private pending = new Map<number, Pending>()
+  private listeners = new Map<number, Listener>()
+
+  constructor(
+    private readonly haUrl: string,
+    private readonly token: string,
+    private readonly onStatus?: (connected: boolean) => void,
+  ) {}
+
+  private connect(): Promise<void> {
+    if (this.ready) {
+      return this.ready
+    }
+
+    const url = `${this.haUrl.replace(/^http/, "ws").replace(/\/$/, "")}/api/websocket`
+
+    this.ready = new Promise((resolve, reject) => {
+      const socket = new WebSocket(url)
+      this.socket = socket
+
+      socket.onmessage = (event) => {
+        const message = JSON.parse(event.data)
+
+        switch (message.type) {
+          case "auth_required":
+            socket.send(JSON.stringify({ type: "auth", access_token: this.token }))
+            break
+          case "auth_ok":
+            this.onStatus?.(true)
+            resolve()
+            break
+          case "auth_invalid":
+            reject(new Error(message.message))
+            socket.close()
+            break
+          case "result": {
+            const pending = this.pending.get(message.id)
+            if (pending) {
+              this.pending.delete(message.id)
+              if (message.success) {
+                pending.resolve(message.result)
+              } else {
+                pending.reject(new Error(message.error?.message ?? "Command failed"))
+              }
+            }
+            break
+          }
+          case "event":
+            this.listeners.get(message.id)?.(message.event)
+            break
+        }
+      }
+
+      socket.onclose = () => {
+        this.onStatus?.(false)
+        this.pending.forEach((pending) => pending.reject(new Error("Connection closed")))
+        this.pending.clear()
+        this.listeners.clear()
+        this.socket = null
+        this.ready = null
+        reject(new Error("Connection closed"))
+      }
+    })
+
+    return this.ready
+  }
+
+  async call<T = unknown>(message: Record<string, unknown>): Promise<T> {
+    await this.connect()
+    const id = this.nextId++
+
+    return new Promise<T>((resolve, reject) => {
+      this.pending.set(id, { resolve: resolve as (result: unknown) => void, reject })
+      this.socket?.send(JSON.stringify({ id, ...message }))
+    })
+  }
+
+  async subscribe(message: Record<string, unknown>, listener: Listener): Promise<() => void> {
+    await this.connect()
+    const id = this.nextId++
+    this.listeners.set(id, listener)
+
+    await new Promise((resolve, reject) => {
+      this.pending.set(id, { resolve, reject })
+      this.socket?.send(JSON.stringify({ id, ...message }))
+    })
+
+    return () => {
+      this.listeners.delete(id)
+      if (this.socket) {
+        this.call({ type: "unsubscribe_events", subscription: id }).catch(() => {})
+      }
+    }
+  }
+
+  close() {
+    this.socket?.close()
+  }
+}
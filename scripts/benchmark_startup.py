@@ -0,0 +1,216 @@
+"""Startup benchmark for the Samsung TV Remote integration.
+
+Measures how long importing the integration and its config flow takes,
+and how long it takes until the entities of 1, 10 and 50 TVs are
+available against a mock SmartThings API. Every size runs twice: a cold start, where each TV's
+device description must be fetched, and a warm start from the stored
+descriptions.
+
+Run from the repository root in an environment with Home Assistant:
+
+    python scripts/benchmark_startup.py --tvs 1,10,50 --latency 80
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+from pathlib import Path
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from unittest.mock import MagicMock
+
+from aiohttp import web
+
+ROOT = Path(__file__).resolve().parent.parent
+INTEGRATION = ROOT / "custom_components" / "samsung_remote"
+DOMAIN = "samsung_remote"
+
+# Import time of what Home Assistant loads for the integration: the
+# component and its config flow, with Home Assistant itself already loaded
+IMPORT_SNIPPET = """
+import sys, time
+import homeassistant.helpers.config_validation, homeassistant.helpers.update_coordinator
+import homeassistant.components.websocket_api
+sys.path.insert(0, sys.argv[1])
+start = time.perf_counter()
+import custom_components.samsung_remote
+import custom_components.samsung_remote.config_flow
+print((time.perf_counter() - start) * 1000)
+"""
+
+
+def measure_import() -> float:
+    """Return the import time of the integration in milliseconds."""
+    result = subprocess.run(
+        [sys.executable, "-c", IMPORT_SNIPPET, str(ROOT)],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    return float(result.stdout.strip())
+
+
+def mock_api(latency: float) -> web.Application:
+    """Return a minimal SmartThings API answering after a fixed latency."""
+    status = {
+        "switch": {"switch": {"value": "on"}},
+        "audioVolume": {"volume": {"value": 10}},
+        "audioMute": {"mute": {"value": "unmuted"}},
+        "tvChannel": {"tvChannel": {"value": "1"}},
+        "mediaInputSource": {
+            "inputSource": {"value": "HDMI1"},
+            "supportedInputSources": {"value": ["HDMI1", "HDMI2"]},
+        },
+    }
+    capabilities = [{"id": capability} for capability in (*status, "samsungvd.remoteControl")]
+
+    async def device(request: web.Request) -> web.Response:
+        await asyncio.sleep(latency)
+        return web.json_response(
+            {
+                "deviceId": request.match_info["device"],
+                "components": [{"id": "main", "capabilities": capabilities}],
+            }
+        )
+
+    async def device_status(request: web.Request) -> web.Response:
+        await asyncio.sleep(latency)
+        return web.json_response({"components": {"main": status}})
+
+    async def commands(request: web.Request) -> web.Response:
+        await asyncio.sleep(latency)
+        return web.json_response({})
+
+    app = web.Application()
+    app.router.add_get("/v1/devices/{device}", device)
+    app.router.add_get("/v1/devices/{device}/status", device_status)
+    app.router.add_post("/v1/devices/{device}/commands", commands)
+    return app
+
+
+async def start_hass(config_dir: Path, api_base: str):
+    """Start a bare Home Assistant with the registries the integration uses."""
+    from homeassistant import config_entries, loader
+    from homeassistant.core import HomeAssistant
+    from homeassistant.helpers import (
+        area_registry as ar,
+        device_registry as dr,
+        entity_registry as er,
+        issue_registry as ir,
+        restore_state,
+    )
+
+    hass = HomeAssistant(str(config_dir))
+    if hasattr(loader, "async_setup"):
+        loader.async_setup(hass)
+    hass.data["entity_info"] = {}
+    # The media_player platform registers an HTTP view
+    hass.http = MagicMock()
+    await restore_state.async_load(hass)
+    for registry in (ar, dr, er, ir):
+        await registry.async_load(hass)
+    hass.config_entries = config_entries.ConfigEntries(hass, {})
+    await hass.config_entries.async_initialize()
+    hass.config.components.update({"smartthings", "http", "websocket_api"})
+
+    import custom_components.samsung_remote.smartthings_bridge as bridge
+
+    # The bridge binds the API base when it is imported
+    bridge.SMARTTHINGS_API_BASE = api_base
+    return hass
+
+
+async def run_startup(config_dir: Path, api_base: str, tvs: int) -> tuple[float, float]:
+    """Set up the TVs and return the seconds until entities and states are available."""
+    from homeassistant import config_entries
+
+    hass = await start_hass(config_dir, api_base)
+    start = time.perf_counter()
+    if stored := hass.config_entries.async_entries(DOMAIN):
+        # A restart: the entries and device descriptions were stored
+        await asyncio.gather(
+            *(hass.config_entries.async_setup(entry.entry_id) for entry in stored)
+        )
+    else:
+        smartthings = config_entries.ConfigEntry(
+            version=1,
+            minor_version=1,
+            domain="smartthings",
+            title="SmartThings",
+            data={"token": {"access_token": "benchmark"}},
+            source="user",
+            options={},
+        )
+        hass.config_entries._entries[smartthings.entry_id] = smartthings
+        await asyncio.gather(
+            *(
+                hass.config_entries.async_add(
+                    config_entries.ConfigEntry(
+                        version=2,
+                        minor_version=1,
+                        domain=DOMAIN,
+                        title=f"TV {index}",
+                        data={
+                            "device_id": f"tv{index}",
+                            "device_name": f"TV {index}",
+                            "smartthings_entry_id": smartthings.entry_id,
+                        },
+                        source="user",
+                        options={},
+                        unique_id=f"tv{index}",
+                    )
+                )
+                for index in range(tvs)
+            )
+        )
+    await hass.async_block_till_done()
+    entities_ready = time.perf_counter() - start
+
+    # States are in once every TV's volume, which needs a status, is available
+    while any(
+        (state := hass.states.get(f"number.tv_{index}_volume")) is None
+        or state.state == "unavailable"
+        for index in range(tvs)
+    ):
+        await asyncio.sleep(0.005)
+    states_ready = time.perf_counter() - start
+
+    await hass.async_stop(force=True)
+    return entities_ready, states_ready
+
+
+async def main(sizes: list[int], latency: float) -> None:
+    """Run the benchmark for each number of TVs."""
+    runner = web.AppRunner(mock_api(latency))
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    api_base = f"http://127.0.0.1:{port}/v1"
+
+    print(f"import: {measure_import():.1f} ms")
+    print(f"{'TVs':>4} {'start':>6} {'entities':>10} {'states':>10}")
+    with tempfile.TemporaryDirectory() as tmp:
+        config_dir = Path(tmp)
+        (config_dir / "custom_components").mkdir()
+        (config_dir / "custom_components" / DOMAIN).symlink_to(INTEGRATION)
+        for tvs in sizes:
+            # A cold start has no stored registries or device descriptions
+            shutil.rmtree(config_dir / ".storage", ignore_errors=True)
+            for start in ("cold", "warm"):
+                entities, states = await run_startup(config_dir, api_base, tvs)
+                print(f"{tvs:>4} {start:>6} {entities * 1000:>8.0f}ms {states * 1000:>8.0f}ms")
+    await runner.cleanup()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tvs", default="1,10,50", help="comma separated numbers of TVs")
+    parser.add_argument("--latency", type=float, default=80, help="API latency in ms")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.ERROR)
+    asyncio.run(main([int(size) for size in args.tvs.split(",")], args.latency / 1000))
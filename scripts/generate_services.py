@@ -0,0 +1,65 @@
+"""Generate the send_key options in services.yaml from the command registry.
+
+The key list in services.yaml only feeds the UI picker; the service
+schema validates against ``KEY_NAMES``. This script rewrites the list so
+the two cannot drift, or with ``--check`` fails if they differ.
+
+Run from the repository root in an environment with Home Assistant:
+
+    python scripts/generate_services.py [--check]
+"""
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+import sys
+
+ROOT = Path(__file__).resolve().parent.parent
+SERVICES = ROOT / "custom_components" / "samsung_remote" / "services.yaml"
+
+# The options block of the send_key key selector
+SERVICE = "send_key:\n"
+OPTIONS = "          options:\n"
+OPTION_PREFIX = "            - "
+
+
+def render_option(name: str) -> str:
+    """Return one option line, quoting names YAML would read as numbers."""
+    value = f'"{name}"' if name.isdigit() else name
+    return f"{OPTION_PREFIX}{value}\n"
+
+
+def generate(text: str, names: list[str]) -> str:
+    """Return the services.yaml text with the send_key options replaced."""
+    start = text.index(OPTIONS, text.index(SERVICE)) + len(OPTIONS)
+    end = start
+    lines = text[start:].splitlines(keepends=True)
+    for line in lines:
+        if not line.startswith(OPTION_PREFIX):
+            break
+        end += len(line)
+    return text[:start] + "".join(render_option(name) for name in names) + text[end:]
+
+
+def main(check: bool) -> int:
+    """Update or check services.yaml and return the exit code."""
+    sys.path.insert(0, str(ROOT))
+    from custom_components.samsung_remote.commands import KEY_NAMES
+
+    text = SERVICES.read_text()
+    generated = generate(text, list(KEY_NAMES))
+    if generated == text:
+        return 0
+    if check:
+        print(f"{SERVICES.relative_to(ROOT)} is out of date, run {Path(__file__).name}")
+        return 1
+    SERVICES.write_text(generated)
+    print(f"Updated {SERVICES.relative_to(ROOT)}")
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--check", action="store_true", help="fail instead of writing")
+    args = parser.parse_args()
+    sys.exit(main(args.check))